@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-__version__ = "0.2.1"
-__all__ = ["async_setup_entry", "async_unload_entry"]
+__version__ = "0.2.6"
+__all__ = ["async_setup_entry", "async_unload_entry", "async_remove_entry"]
 
 import logging
 
@@ -20,17 +20,19 @@ from .const import (
     CONF_ERROR_THRESHOLD,
     CONF_HOST_IP,
     CONF_LOG_LEVEL_THRESHOLD_FOR_CONNECTION_ERRORS,
-    DEFAULT_API_TIMEOUT,
-    DEFAULT_CONNECT_TIMEOUT,
-    DEFAULT_ERROR_THRESHOLD,
-    DEFAULT_LOG_LEVEL_THRESHOLD_FOR_CONNECTION_ERRORS,
     DOMAIN,
     LIFECYCLE_LOGGER_NAME,
+    POLLING_GROUP_DEFINITIONS,
+    get_sensor_definitions,
+)
+from .coordinator import (
+    HdgDataUpdateCoordinator,
+    async_create_and_refresh_coordinator,
+    async_remove_polling_state,
 )
-from .coordinator import HdgDataUpdateCoordinator, async_create_and_refresh_coordinator
-from .definitions import POLLING_GROUP_DEFINITIONS, SENSOR_DEFINITIONS
 from .helpers.api_access_manager import HdgApiAccessManager
 from .helpers.logging_utils import configure_loggers
+from .helpers.validation_utils import get_bounded_option
 from .registry import HdgEntityRegistry
 
 _LOGGER = logging.getLogger(DOMAIN)
@@ -48,8 +50,8 @@ def _create_api_and_access_manager(
     api_client = HdgApiClient(
         session,
         host_ip,
-        entry.options.get(CONF_API_TIMEOUT, DEFAULT_API_TIMEOUT),
-        entry.options.get(CONF_CONNECT_TIMEOUT, DEFAULT_CONNECT_TIMEOUT),
+        get_bounded_option(entry.options, CONF_API_TIMEOUT),
+        get_bounded_option(entry.options, CONF_CONNECT_TIMEOUT),
     )
     access_manager = HdgApiAccessManager(
         hass,
@@ -68,18 +70,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         return False
 
     api_client, api_access_manager = _create_api_and_access_manager(hass, entry)
+    # The definitions module is imported on first use; keep that off the loop.
+    sensor_definitions = await hass.async_add_executor_job(get_sensor_definitions)
     hdg_entity_registry = HdgEntityRegistry(
-        SENSOR_DEFINITIONS, POLLING_GROUP_DEFINITIONS
+        sensor_definitions, POLLING_GROUP_DEFINITIONS
     )
     api_access_manager.start(entry)  # Start the worker before awaiting the coordinator
-    log_level_threshold = entry.options.get(
-        CONF_LOG_LEVEL_THRESHOLD_FOR_CONNECTION_ERRORS,
-        DEFAULT_LOG_LEVEL_THRESHOLD_FOR_CONNECTION_ERRORS,
-    )
-    error_threshold = entry.options.get(
-        CONF_ERROR_THRESHOLD,
-        DEFAULT_ERROR_THRESHOLD,
+    log_level_threshold = int(
+        get_bounded_option(
+            entry.options, CONF_LOG_LEVEL_THRESHOLD_FOR_CONNECTION_ERRORS
+        )
     )
+    error_threshold = int(get_bounded_option(entry.options, CONF_ERROR_THRESHOLD))
 
     try:
         coordinator = await async_create_and_refresh_coordinator(
@@ -93,7 +95,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         )
     except ConfigEntryNotReady:
         await api_access_manager.stop()
-        return False
+        raise
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
         "coordinator": coordinator,
@@ -134,6 +136,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return bool(unload_ok)
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Clean up data stored for a config entry that is being removed."""
+    await async_remove_polling_state(hass, entry)
+
+
 async def _async_options_update_listener(
     hass: HomeAssistant, entry: ConfigEntry
 ) -> None:
@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
-__version__ = "0.3.0"
+__version__ = "0.3.3"
 __all__ = ["HdgApiClient"]
 
 import functools
+import logging
 import time
 from collections.abc import Awaitable, Callable
 from typing import Any, Concatenate
 
 import aiohttp
 from aiohttp import ClientError
+from homeassistant.util.json import json_loads
+from yarl import URL
 
 from .const import (
     ACCEPTED_CONTENT_TYPES,
@@ -87,8 +90,14 @@ class HdgApiClient:
             raise HdgApiError(f"Invalid host_address provided: '{host_address}'")
 
         self._base_url = prepared_base_url
-        self._url_data_refresh = f"{self._base_url}{API_ENDPOINT_DATA_REFRESH}"
-        self._url_set_value_base = f"{self._base_url}{API_ENDPOINT_SET_VALUE}"
+        # Build the request URLs once; aiohttp would otherwise parse the string
+        # form on every request.
+        self._url_data_refresh = URL(
+            f"{self._base_url}{API_ENDPOINT_DATA_REFRESH}", encoded=True
+        )
+        self._url_set_value_base = URL(
+            f"{self._base_url}{API_ENDPOINT_SET_VALUE}", encoded=True
+        )
 
     @property
     def base_url(self) -> str:
@@ -120,8 +129,9 @@ class HdgApiClient:
             raise HdgApiResponseError(f"Unexpected Content-Type: {content_type}")
 
         try:
-            return await response.json()
-        except (aiohttp.ContentTypeError, ValueError) as err:
+            # Home Assistant's orjson-backed decoder, straight from the raw bytes.
+            return json_loads(await response.read())
+        except ValueError as err:
             text = await response.text()
             _LOGGER.warning(
                 "Failed to parse JSON (Content-Type: '%s'): %s. Response: %s",
@@ -132,11 +142,14 @@ class HdgApiClient:
             raise HdgApiResponseError(f"Failed to parse JSON: {err}") from err
 
     @handle_api_errors
-    async def async_get_nodes_data(self, node_payload_str: str) -> list[dict[str, Any]]:
+    async def async_get_nodes_data(
+        self, node_payload_str: str | bytes
+    ) -> list[dict[str, Any]]:
         """Fetch data for a specified set of nodes from the HDG boiler.
 
         Args:
-            node_payload_str: A string containing the node IDs for the data refresh.
+            node_payload_str: The node IDs for the data refresh, either as a string
+                or already encoded as bytes.
 
         Returns:
             A list of dictionaries, where each dictionary represents a node's data.
@@ -193,9 +206,10 @@ class HdgApiClient:
             response_text = await response.text()
             response.raise_for_status()  # Will raise ClientResponseError for 4xx/5xx
 
-            _API_LOGGER.debug(
-                "Successfully set node '%s'. Response: %s",
-                node_id,
-                format_for_log(response_text),
-            )
+            if _API_LOGGER.isEnabledFor(logging.DEBUG):
+                _API_LOGGER.debug(
+                    "Successfully set node '%s'. Response: %s",
+                    node_id,
+                    format_for_log(response_text),
+                )
             return True
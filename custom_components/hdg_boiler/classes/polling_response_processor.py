@@ -7,20 +7,18 @@ to manage the state of boiler data nodes.
 
 from __future__ import annotations
 
-__version__ = "0.4.0"
+__version__ = "0.4.10"
 
 import logging
+import sys
 import time
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, Final, cast
 
-from ..const import (
-    CONF_RECENTLY_SET_POLL_IGNORE_WINDOW_S,
-    DEFAULT_RECENTLY_SET_POLL_IGNORE_WINDOW_S,
-    PROCESSOR_LOGGER_NAME,
-)
+from ..const import CONF_RECENTLY_SET_POLL_IGNORE_WINDOW_S, PROCESSOR_LOGGER_NAME
 from ..helpers.logging_utils import _LOGGER, format_for_log
 from ..helpers.parsers import parse_sensor_value
 from ..helpers.string_utils import strip_hdg_node_suffix
+from ..helpers.validation_utils import get_bounded_option
 
 if TYPE_CHECKING:
     from ..coordinator import HdgDataUpdateCoordinator
@@ -28,6 +26,10 @@ if TYPE_CHECKING:
 
 _PROCESSOR_LOGGER = logging.getLogger(PROCESSOR_LOGGER_NAME)
 
+# Short text values (states, enum texts, "---") repeat on every poll; interning
+# them lets the stored values be shared and compared by identity.
+_INTERN_MAX_LEN: Final = 32
+
 
 class HdgPollingResponseProcessor:
     """Processes raw API polling responses."""
@@ -35,25 +37,22 @@ class HdgPollingResponseProcessor:
     def __init__(self, coordinator: HdgDataUpdateCoordinator) -> None:
         """Initialize the HdgPollingResponseProcessor."""
         self._coordinator = coordinator
+        # API IDs seen in responses, resolved to their base node ID and entity
+        # definition; the set of polled IDs is static, so each resolves once.
+        self._resolved_api_ids: dict[str, tuple[str, SensorDefinition | None]] = {}
+        # Option changes reload the entry, so the window is fixed for our lifetime.
+        self._ignore_window_s = get_bounded_option(
+            coordinator.entry.options, CONF_RECENTLY_SET_POLL_IGNORE_WINDOW_S
+        )
         _PROCESSOR_LOGGER.debug("HdgPollingResponseProcessor initialized.")
 
-    def _get_entity_definition(
-        self, node_id_with_suffix: str
-    ) -> SensorDefinition | None:
-        """Retrieve the entity definition for a given node ID."""
-        node_id_for_lookup = (
-            node_id_with_suffix
-            if node_id_with_suffix.endswith("T")
-            else f"{node_id_with_suffix}T"
-        )
-        definition = (
-            self._coordinator.hdg_entity_registry.get_entity_definition_by_node_id(
-                node_id_for_lookup
-            )
-        )
+    def _get_entity_definition(self, node_id: str) -> SensorDefinition | None:
+        """Retrieve the entity definition for a given base node ID."""
+        registry = self._coordinator.hdg_entity_registry
+        definition = registry.get_entity_definition_by_base_node_id(node_id)
         if not definition:
             _PROCESSOR_LOGGER.warning(
-                "No entity definition found for node ID '%s'.", node_id_for_lookup
+                "No entity definition found for node ID '%s'.", node_id
             )
         return definition
 
@@ -66,14 +65,7 @@ class HdgPollingResponseProcessor:
         if last_set_time == 0.0:
             return False
 
-        timeout = cast(
-            float,
-            self._coordinator.entry.options.get(
-                CONF_RECENTLY_SET_POLL_IGNORE_WINDOW_S,
-                DEFAULT_RECENTLY_SET_POLL_IGNORE_WINDOW_S,
-            ),
-        )
-        return (time.monotonic() - last_set_time) < timeout
+        return (time.monotonic() - last_set_time) < self._ignore_window_s
 
     def _should_ignore_polled_value(
         self, node_id: str, parsed_polled_value: Any, group_key: str
@@ -119,7 +111,7 @@ class HdgPollingResponseProcessor:
                 format_for_log(existing_value),
                 format_for_log(new_value),
             )
-        else:
+        elif _PROCESSOR_LOGGER.isEnabledFor(logging.DEBUG):
             _PROCESSOR_LOGGER.debug(
                 log_message,
                 node_id,
@@ -134,10 +126,15 @@ class HdgPollingResponseProcessor:
         self,
         item: dict[str, Any],
         group_key: str,
+        data: dict[str, Any],
         processed_ids: set[str],
+        changed_ids: set[str],
     ) -> None:
         """Process a single item from the API response."""
-        api_id = str(item.get("id", "")).strip()
+        api_id = item.get("id", "")
+        if type(api_id) is not str:
+            api_id = str(api_id)
+        api_id = api_id.strip()
         raw_value = item.get("text")
 
         if not api_id or raw_value is None:
@@ -148,49 +145,69 @@ class HdgPollingResponseProcessor:
             )
             return
 
-        node_id = strip_hdg_node_suffix(api_id)
-        definition = self._get_entity_definition(api_id)
+        if (resolved := self._resolved_api_ids.get(api_id)) is None:
+            node_id = strip_hdg_node_suffix(api_id)
+            resolved = (node_id, self._get_entity_definition(node_id))
+            self._resolved_api_ids[api_id] = resolved
+        node_id, definition = resolved
         if not definition:
             return
 
         parsed_value = parse_sensor_value(
-            str(raw_value),
+            raw_value if type(raw_value) is str else str(raw_value),
             cast(dict[str, Any], definition),
             node_id_for_log=node_id,
             entity_id_for_log=definition.get("translation_key"),
         )
-
-        if self._should_ignore_polled_value(node_id, parsed_value, group_key):
-            return
+        if type(parsed_value) is str and len(parsed_value) <= _INTERN_MAX_LEN:
+            parsed_value = sys.intern(parsed_value)
 
         if node_id in processed_ids:
             self._handle_duplicate_node_id(node_id, parsed_value, group_key, api_id)
             return
-
-        self._coordinator.data[node_id] = parsed_value
+        # A value ignored after a recent set still counts as received.
         processed_ids.add(node_id)
 
+        if self._should_ignore_polled_value(node_id, parsed_value, group_key):
+            return
+
+        # Unchanged values, the common case, cost a single lookup.
+        if data.get(node_id) != parsed_value:
+            data[node_id] = parsed_value
+            changed_ids.add(node_id)
+
     def process_api_items(
         self,
         group_key: str,
         api_items: list[dict[str, Any]],
-    ) -> None:
-        """Parse, validate, and store API items from a polling group response."""
+    ) -> tuple[set[str], set[str]]:
+        """Parse, validate, and store API items from a polling group response.
+
+        Returns:
+            The base node IDs received in the response, and those of them whose
+            stored value changed.
+
+        """
+        processed_ids: set[str] = set()
+        changed_ids: set[str] = set()
         if not isinstance(api_items, list):
             _PROCESSOR_LOGGER.warning(
                 "Invalid API response for group '%s': expected a list, got %s.",
                 group_key,
                 type(api_items).__name__,
             )
-            return
+            return processed_ids, changed_ids
 
-        processed_ids_this_call: set[str] = set()
+        # Bound once for the whole response rather than looked up per item.
+        data = self._coordinator.data
+        process_item = self._process_single_item
         for item in api_items:
             if isinstance(item, dict):
-                self._process_single_item(item, group_key, processed_ids_this_call)
+                process_item(item, group_key, data, processed_ids, changed_ids)
             else:
                 _PROCESSOR_LOGGER.warning(
                     "API item in group '%s' is not a dictionary: %s. Skipping.",
                     group_key,
                     format_for_log(item),
                 )
+        return processed_ids, changed_ids
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-__version__ = "0.3.2"
+__version__ = "0.3.6"
 __all__ = ["HdgBoilerConfigFlow"]
 
 from typing import Any, TypedDict
@@ -10,7 +10,6 @@ from urllib.parse import urlparse
 
 import voluptuous as vol
 from homeassistant import config_entries, core
-from homeassistant.const import CONF_SCAN_INTERVAL
 from homeassistant.core import callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.selector import (
@@ -26,6 +25,8 @@ from homeassistant.helpers.selector import (
 
 from .api import HdgApiClient, HdgApiConnectionError, HdgApiError
 from .const import (
+    CONF_ADAPTIVE_POLLING_MAX_FACTOR,
+    CONF_ADAPTIVE_POLLING_MIN_FACTOR,
     CONF_ADVANCED_LOGGING,
     CONF_API_TIMEOUT,
     CONF_CONNECT_TIMEOUT,
@@ -40,20 +41,19 @@ from .const import (
     CONF_RECENTLY_SET_POLL_IGNORE_WINDOW_S,
     CONF_SOURCE_TIMEZONE,
     CONFIG_FLOW_API_TIMEOUT,
-    CONFIG_FLOW_TEST_PAYLOAD,
+    CONFIG_FLOW_TEST_PAYLOAD_BYTES,
+    DEFAULT_ADAPTIVE_POLLING_MAX_FACTOR,
+    DEFAULT_ADAPTIVE_POLLING_MIN_FACTOR,
     DEFAULT_ADVANCED_LOGGING,
-    DEFAULT_API_TIMEOUT,
     DEFAULT_CONNECT_TIMEOUT,
-    DEFAULT_ERROR_THRESHOLD,
     DEFAULT_FALLBACK_PING_INTERVAL,
     DEFAULT_LOG_LEVEL,
-    DEFAULT_LOG_LEVEL_THRESHOLD_FOR_CONNECTION_ERRORS,
-    DEFAULT_LOG_LEVEL_THRESHOLD_FOR_PREEMPTION_ERRORS,
-    DEFAULT_POLLING_PREEMPTION_TIMEOUT,
     DEFAULT_RECENTLY_SET_POLL_IGNORE_WINDOW_S,
     DEFAULT_SOURCE_TIMEZONE,
     DOMAIN,
-    LOG_LEVELS,
+    LOG_LEVEL_NAMES,
+    MAX_ADAPTIVE_POLLING_MAX_FACTOR,
+    MAX_ADAPTIVE_POLLING_MIN_FACTOR,
     MAX_API_TIMEOUT,
     MAX_CONNECT_TIMEOUT,
     MAX_ERROR_THRESHOLD,
@@ -63,6 +63,8 @@ from .const import (
     MAX_POLLING_PREEMPTION_TIMEOUT,
     MAX_RECENTLY_SET_POLL_IGNORE_WINDOW_S,
     MAX_SCAN_INTERVAL,
+    MIN_ADAPTIVE_POLLING_MAX_FACTOR,
+    MIN_ADAPTIVE_POLLING_MIN_FACTOR,
     MIN_API_TIMEOUT,
     MIN_CONNECT_TIMEOUT,
     MIN_ERROR_THRESHOLD,
@@ -72,7 +74,10 @@ from .const import (
     MIN_POLLING_PREEMPTION_TIMEOUT,
     MIN_RECENTLY_SET_POLL_IGNORE_WINDOW_S,
     MIN_SCAN_INTERVAL,
-    POLLING_GROUP_DEFINITIONS,
+    NUMERIC_OPTION_BOUNDS,
+    POLLING_GROUP_DEFAULT_INTERVALS,
+    POLLING_GROUP_SCAN_INTERVAL_KEYS,
+    POLLING_GROUP_STATIC_KEYS,
 )
 from .helpers.logging_utils import _LOGGER
 from .helpers.network_utils import async_execute_icmp_ping, prepare_base_url
@@ -103,7 +108,7 @@ async def _test_api_connectivity(hass: core.HomeAssistant, host_ip: str) -> bool
     api_client = HdgApiClient(
         session, host_ip, CONFIG_FLOW_API_TIMEOUT, DEFAULT_CONNECT_TIMEOUT
     )
-    test_data = await api_client.async_get_nodes_data(CONFIG_FLOW_TEST_PAYLOAD)
+    test_data = await api_client.async_get_nodes_data(CONFIG_FLOW_TEST_PAYLOAD_BYTES)
 
     if test_data and isinstance(test_data, list):
         _LOGGER.debug("Successfully fetched test nodes from %s.", host_ip)
@@ -197,17 +202,18 @@ class HdgBoilerOptionsFlowHandler(config_entries.OptionsFlow):
         schema: dict[vol.Marker, Any] = {}
 
         # Polling intervals
-        for group in POLLING_GROUP_DEFINITIONS:
-            key = f"{CONF_SCAN_INTERVAL}_{group['key']}"
-            schema[
-                vol.Optional(key, default=options.get(key, group["default_interval"]))
-            ] = NumberSelector(
-                NumberSelectorConfig(
-                    min=MIN_SCAN_INTERVAL,
-                    max=MAX_SCAN_INTERVAL,
-                    step=1,
-                    mode=NumberSelectorMode.BOX,
-                    unit_of_measurement="s",
+        for key, default_interval in zip(
+            POLLING_GROUP_SCAN_INTERVAL_KEYS, POLLING_GROUP_DEFAULT_INTERVALS
+        ):
+            schema[vol.Optional(key, default=options.get(key, default_interval))] = (
+                NumberSelector(
+                    NumberSelectorConfig(
+                        min=MIN_SCAN_INTERVAL,
+                        max=MAX_SCAN_INTERVAL,
+                        step=1,
+                        mode=NumberSelectorMode.BOX,
+                        unit_of_measurement="s",
+                    )
                 )
             )
 
@@ -217,7 +223,7 @@ class HdgBoilerOptionsFlowHandler(config_entries.OptionsFlow):
                 CONF_LOG_LEVEL,
                 SelectSelector(
                     SelectSelectorConfig(
-                        options=LOG_LEVELS, mode=SelectSelectorMode.DROPDOWN
+                        options=LOG_LEVEL_NAMES, mode=SelectSelectorMode.DROPDOWN
                     )
                 ),
                 DEFAULT_LOG_LEVEL,
@@ -240,91 +246,30 @@ class HdgBoilerOptionsFlowHandler(config_entries.OptionsFlow):
         for key, selector, default, marker in schema_definitions:
             schema[marker(key, default=options.get(key, default))] = selector
 
-        # Number selectors
-        number_schema_definitions: list[
-            tuple[str, float | int, NumberSelectorConfigDict]
-        ] = [
-            (
-                CONF_API_TIMEOUT,
-                DEFAULT_API_TIMEOUT,
-                {
-                    "min": MIN_API_TIMEOUT,
-                    "max": MAX_API_TIMEOUT,
-                    "step": 1,
-                    "unit_of_measurement": "s",
-                },
-            ),
-            (
-                CONF_CONNECT_TIMEOUT,
-                DEFAULT_CONNECT_TIMEOUT,
-                {
-                    "min": MIN_CONNECT_TIMEOUT,
-                    "max": MAX_CONNECT_TIMEOUT,
-                    "step": 0.1,
-                    "unit_of_measurement": "s",
-                },
-            ),
-            (
-                CONF_POLLING_PREEMPTION_TIMEOUT,
-                DEFAULT_POLLING_PREEMPTION_TIMEOUT,
-                {
-                    "min": MIN_POLLING_PREEMPTION_TIMEOUT,
-                    "max": MAX_POLLING_PREEMPTION_TIMEOUT,
-                    "step": 1,
-                    "unit_of_measurement": "s",
-                },
-            ),
-            (
-                CONF_LOG_LEVEL_THRESHOLD_FOR_CONNECTION_ERRORS,
-                DEFAULT_LOG_LEVEL_THRESHOLD_FOR_CONNECTION_ERRORS,
-                {
-                    "min": MIN_LOG_LEVEL_THRESHOLD_FOR_CONNECTION_ERRORS,
-                    "max": MAX_LOG_LEVEL_THRESHOLD_FOR_CONNECTION_ERRORS,
-                    "step": 1,
-                },
-            ),
-            (
-                CONF_ERROR_THRESHOLD,
-                DEFAULT_ERROR_THRESHOLD,
-                {
-                    "min": MIN_ERROR_THRESHOLD,
-                    "max": MAX_ERROR_THRESHOLD,
-                    "step": 1,
-                },
-            ),
-            (
-                CONF_LOG_LEVEL_THRESHOLD_FOR_PREEMPTION_ERRORS,
-                DEFAULT_LOG_LEVEL_THRESHOLD_FOR_PREEMPTION_ERRORS,
-                {
-                    "min": MIN_LOG_LEVEL_THRESHOLD_FOR_PREEMPTION_ERRORS,
-                    "max": MAX_LOG_LEVEL_THRESHOLD_FOR_PREEMPTION_ERRORS,
-                    "step": 1,
-                },
-            ),
-            (
-                CONF_RECENTLY_SET_POLL_IGNORE_WINDOW_S,
-                DEFAULT_RECENTLY_SET_POLL_IGNORE_WINDOW_S,
-                {
-                    "min": MIN_RECENTLY_SET_POLL_IGNORE_WINDOW_S,
-                    "max": MAX_RECENTLY_SET_POLL_IGNORE_WINDOW_S,
-                    "step": 1,
-                    "unit_of_measurement": "s",
-                },
-            ),
-            (
-                CONF_FALLBACK_PING_INTERVAL,
-                DEFAULT_FALLBACK_PING_INTERVAL,
-                {
-                    "min": MIN_FALLBACK_PING_INTERVAL,
-                    "max": MAX_FALLBACK_PING_INTERVAL,
-                    "step": 1,
-                    "unit_of_measurement": "s",
-                },
-            ),
+        # Number selectors; ranges and defaults come from NUMERIC_OPTION_BOUNDS.
+        number_schema_definitions: list[tuple[str, float, str | None]] = [
+            (CONF_API_TIMEOUT, 1, "s"),
+            (CONF_CONNECT_TIMEOUT, 0.1, "s"),
+            (CONF_POLLING_PREEMPTION_TIMEOUT, 1, "s"),
+            (CONF_LOG_LEVEL_THRESHOLD_FOR_CONNECTION_ERRORS, 1, None),
+            (CONF_ERROR_THRESHOLD, 1, None),
+            (CONF_LOG_LEVEL_THRESHOLD_FOR_PREEMPTION_ERRORS, 1, None),
+            (CONF_RECENTLY_SET_POLL_IGNORE_WINDOW_S, 1, "s"),
+            (CONF_FALLBACK_PING_INTERVAL, 1, "s"),
+            (CONF_ADAPTIVE_POLLING_MIN_FACTOR, 0.1, None),
+            (CONF_ADAPTIVE_POLLING_MAX_FACTOR, 0.5, None),
         ]
 
-        for key, default, config in number_schema_definitions:
-            config["mode"] = NumberSelectorMode.BOX
+        for key, step, unit in number_schema_definitions:
+            min_val, max_val, default = NUMERIC_OPTION_BOUNDS[key]
+            config: NumberSelectorConfigDict = {
+                "min": min_val,
+                "max": max_val,
+                "step": step,
+                "mode": NumberSelectorMode.BOX,
+            }
+            if unit:
+                config["unit_of_measurement"] = unit
             schema[vol.Optional(key, default=options.get(key, default))] = (
                 NumberSelector(NumberSelectorConfig(**config))
             )
@@ -354,11 +299,17 @@ class HdgBoilerOptionsFlowHandler(config_entries.OptionsFlow):
             "min_fallback_ping_interval": MIN_FALLBACK_PING_INTERVAL,
             "max_fallback_ping_interval": MAX_FALLBACK_PING_INTERVAL,
             "default_fallback_ping_interval": DEFAULT_FALLBACK_PING_INTERVAL,
+            "min_adaptive_min_factor": MIN_ADAPTIVE_POLLING_MIN_FACTOR,
+            "max_adaptive_min_factor": MAX_ADAPTIVE_POLLING_MIN_FACTOR,
+            "default_adaptive_min_factor": DEFAULT_ADAPTIVE_POLLING_MIN_FACTOR,
+            "min_adaptive_max_factor": MIN_ADAPTIVE_POLLING_MAX_FACTOR,
+            "max_adaptive_max_factor": MAX_ADAPTIVE_POLLING_MAX_FACTOR,
+            "default_adaptive_max_factor": DEFAULT_ADAPTIVE_POLLING_MAX_FACTOR,
         }
         placeholders = {k: str(v) for k, v in placeholders_map.items()}
 
-        for group in POLLING_GROUP_DEFINITIONS:
-            placeholders[f"default_scan_interval_{group['key']}"] = str(
-                group["default_interval"]
-            )
+        for group_key, default_interval in zip(
+            POLLING_GROUP_STATIC_KEYS, POLLING_GROUP_DEFAULT_INTERVALS
+        ):
+            placeholders[f"default_scan_interval_{group_key}"] = str(default_interval)
         return placeholders
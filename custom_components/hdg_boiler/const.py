@@ -3,11 +3,21 @@
 
 from __future__ import annotations
 
-from typing import Final
+import logging
+from functools import cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Final
+
+from homeassistant.const import CONF_SCAN_INTERVAL
 
 from .models import PollingGroupStaticDefinition
 
-__all__: Final[list[str]] = [
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from .models import SensorDefinition
+
+__all__: Final[tuple[str, ...]] = (
     "DOMAIN",
     "DEFAULT_NAME",
     "MANUFACTURER",
@@ -25,6 +35,8 @@ __all__: Final[list[str]] = [
     "CONF_ERROR_THRESHOLD",
     "CONF_LOG_LEVEL_THRESHOLD_FOR_PREEMPTION_ERRORS",
     "CONF_FALLBACK_PING_INTERVAL",
+    "CONF_ADAPTIVE_POLLING_MIN_FACTOR",
+    "CONF_ADAPTIVE_POLLING_MAX_FACTOR",
     "CONFIG_FLOW_API_TIMEOUT",
     "DEFAULT_API_TIMEOUT",
     "MIN_API_TIMEOUT",
@@ -41,6 +53,14 @@ __all__: Final[list[str]] = [
     "DEFAULT_RECENTLY_SET_POLL_IGNORE_WINDOW_S",
     "MIN_RECENTLY_SET_POLL_IGNORE_WINDOW_S",
     "MAX_RECENTLY_SET_POLL_IGNORE_WINDOW_S",
+    "DEFAULT_ADAPTIVE_POLLING_MIN_FACTOR",
+    "MIN_ADAPTIVE_POLLING_MIN_FACTOR",
+    "MAX_ADAPTIVE_POLLING_MIN_FACTOR",
+    "DEFAULT_ADAPTIVE_POLLING_MAX_FACTOR",
+    "MIN_ADAPTIVE_POLLING_MAX_FACTOR",
+    "MAX_ADAPTIVE_POLLING_MAX_FACTOR",
+    "ADAPTIVE_POLLING_EWMA_ALPHA",
+    "ADAPTIVE_POLLING_TARGET_CHANGE_RATE",
     "DEFAULT_LOG_LEVEL",
     "DEFAULT_ADVANCED_LOGGING",
     "DEFAULT_LOG_LEVEL_THRESHOLD_FOR_CONNECTION_ERRORS",
@@ -52,19 +72,28 @@ __all__: Final[list[str]] = [
     "DEFAULT_LOG_LEVEL_THRESHOLD_FOR_PREEMPTION_ERRORS",
     "MIN_LOG_LEVEL_THRESHOLD_FOR_PREEMPTION_ERRORS",
     "MAX_LOG_LEVEL_THRESHOLD_FOR_PREEMPTION_ERRORS",
+    "NUMERIC_OPTION_BOUNDS",
     "DEFAULT_SOURCE_TIMEZONE",
     "API_ENDPOINT_DATA_REFRESH",
     "API_ENDPOINT_SET_VALUE",
     "CONFIG_FLOW_TEST_PAYLOAD",
+    "CONFIG_FLOW_TEST_PAYLOAD_BYTES",
     "API_REQUEST_TYPE_SET_NODE_VALUE",
     "API_REQUEST_TYPE_GET_NODES_DATA",
+    "POLLING_BATCH_MAX_NODES",
+    "POLLING_MAX_CONCURRENT_REQUESTS",
+    "POLLING_WAKE_SLACK_S",
     "ACCEPTED_CONTENT_TYPES",
     "HDG_UNAVAILABLE_STRINGS",
     "HDG_DATETIME_SPECIAL_TEXT",
     "KNOWN_HDG_API_SETTER_SUFFIXES",
     "INITIAL_REFRESH_API_TIMEOUT_OVERRIDE",
+    "INITIAL_REFRESH_TIMEOUT_S",
     "POST_INITIAL_REFRESH_COOLDOWN_S",
-    "INITIAL_SEQUENTIAL_INTER_GROUP_DELAY_S",
+    "POLLING_STATE_STORAGE_KEY",
+    "POLLING_STATE_STORAGE_VERSION",
+    "POLLING_STATE_SAVE_DELAY_S",
+    "UNEXPECTED_ERROR_TRACEBACK_INTERVAL_S",
     "SET_NODE_COOLDOWN_S",
     "DEFAULT_SET_VALUE_DEBOUNCE_DELAY_S",
     "MIN_SCAN_INTERVAL",
@@ -76,13 +105,17 @@ __all__: Final[list[str]] = [
     "POLLING_RETRY_MAX_DELAY_S",
     "POLLING_RETRY_BACKOFF_FACTOR",
     "POLLING_RETRY_MAX_ATTEMPTS",
+    "POLLING_RETRY_SCHEDULE_S",
     "SET_VALUE_RETRY_ATTEMPTS",
     "SET_VALUE_RETRY_DELAY_S",
+    "LOW_PRIORITY_REQUEST_RATE_PER_S",
+    "LOW_PRIORITY_REQUEST_BURST",
     "SERVICE_GET_NODE_VALUE",
     "SERVICE_SET_NODE_VALUE",
     "ATTR_NODE_ID",
     "ATTR_VALUE",
     "LOG_LEVELS",
+    "LOG_LEVEL_NAMES",
     "LIFECYCLE_LOGGER_NAME",
     "ENTITY_DETAIL_LOGGER_NAME",
     "API_LOGGER_NAME",
@@ -93,9 +126,13 @@ __all__: Final[list[str]] = [
     "DIAGNOSTICS_SENSITIVE_COORDINATOR_DATA_NODE_IDS",
     "DIAGNOSTICS_REDACTED_PLACEHOLDER",
     "POLLING_GROUP_DEFINITIONS",
-]
+    "POLLING_GROUP_STATIC_KEYS",
+    "POLLING_GROUP_DEFAULT_INTERVALS",
+    "POLLING_GROUP_SCAN_INTERVAL_KEYS",
+    "get_sensor_definitions",
+)
 
-__version__: Final[str] = "1.2.5"
+__version__: Final[str] = "1.2.30"
 
 # --------------------------------------------------------------------------------
 # Core Integration Constants
@@ -126,6 +163,8 @@ CONF_LOG_LEVEL_THRESHOLD_FOR_PREEMPTION_ERRORS: Final[str] = (
     "log_level_threshold_for_preemption_errors"
 )
 CONF_FALLBACK_PING_INTERVAL: Final[str] = "fallback_ping_interval"
+CONF_ADAPTIVE_POLLING_MIN_FACTOR: Final[str] = "adaptive_polling_min_factor"
+CONF_ADAPTIVE_POLLING_MAX_FACTOR: Final[str] = "adaptive_polling_max_factor"
 
 # --------------------------------------------------------------------------------
 # Default Values & Limits for Configuration
@@ -154,6 +193,24 @@ DEFAULT_RECENTLY_SET_POLL_IGNORE_WINDOW_S: Final[int] = 10
 MIN_RECENTLY_SET_POLL_IGNORE_WINDOW_S: Final[int] = 5
 MAX_RECENTLY_SET_POLL_IGNORE_WINDOW_S: Final[int] = 30
 
+# Adaptive polling: a group's configured scan interval is scaled by a factor in
+# [min_factor, max_factor], derived from how often its values change. Both
+# defaults are 1, so adaptive polling is opt-in and existing installs keep their
+# configured intervals; raising the maximum lets quiet groups be polled less often.
+DEFAULT_ADAPTIVE_POLLING_MIN_FACTOR: Final[float] = 1.0
+MIN_ADAPTIVE_POLLING_MIN_FACTOR: Final[float] = 0.1
+MAX_ADAPTIVE_POLLING_MIN_FACTOR: Final[float] = 1.0
+
+DEFAULT_ADAPTIVE_POLLING_MAX_FACTOR: Final[float] = 1.0
+MIN_ADAPTIVE_POLLING_MAX_FACTOR: Final[float] = 1.0
+MAX_ADAPTIVE_POLLING_MAX_FACTOR: Final[float] = 16.0
+
+# Smoothing factor of the per-group change-rate moving average.
+ADAPTIVE_POLLING_EWMA_ALPHA: Final[float] = 0.3
+# Change rate (average fraction of a group's nodes changed per poll) at which a
+# group is polled at exactly its configured interval.
+ADAPTIVE_POLLING_TARGET_CHANGE_RATE: Final[float] = 0.1
+
 # Logging & Error Thresholds
 DEFAULT_LOG_LEVEL: Final[str] = "INFO"
 DEFAULT_ADVANCED_LOGGING: Final[bool] = False
@@ -170,6 +227,61 @@ DEFAULT_LOG_LEVEL_THRESHOLD_FOR_PREEMPTION_ERRORS: Final[int] = 3
 MIN_LOG_LEVEL_THRESHOLD_FOR_PREEMPTION_ERRORS: Final[int] = 1
 MAX_LOG_LEVEL_THRESHOLD_FOR_PREEMPTION_ERRORS: Final[int] = 10
 
+# (min, max, default) for each numeric option, used by the options flow schema
+# and when the options are read back.
+NUMERIC_OPTION_BOUNDS: Final[dict[str, tuple[float, float, float]]] = {
+    CONF_API_TIMEOUT: (MIN_API_TIMEOUT, MAX_API_TIMEOUT, DEFAULT_API_TIMEOUT),
+    CONF_CONNECT_TIMEOUT: (
+        MIN_CONNECT_TIMEOUT,
+        MAX_CONNECT_TIMEOUT,
+        DEFAULT_CONNECT_TIMEOUT,
+    ),
+    CONF_POLLING_PREEMPTION_TIMEOUT: (
+        MIN_POLLING_PREEMPTION_TIMEOUT,
+        MAX_POLLING_PREEMPTION_TIMEOUT,
+        DEFAULT_POLLING_PREEMPTION_TIMEOUT,
+    ),
+    CONF_LOG_LEVEL_THRESHOLD_FOR_CONNECTION_ERRORS: (
+        MIN_LOG_LEVEL_THRESHOLD_FOR_CONNECTION_ERRORS,
+        MAX_LOG_LEVEL_THRESHOLD_FOR_CONNECTION_ERRORS,
+        DEFAULT_LOG_LEVEL_THRESHOLD_FOR_CONNECTION_ERRORS,
+    ),
+    CONF_ERROR_THRESHOLD: (
+        MIN_ERROR_THRESHOLD,
+        MAX_ERROR_THRESHOLD,
+        DEFAULT_ERROR_THRESHOLD,
+    ),
+    CONF_LOG_LEVEL_THRESHOLD_FOR_PREEMPTION_ERRORS: (
+        MIN_LOG_LEVEL_THRESHOLD_FOR_PREEMPTION_ERRORS,
+        MAX_LOG_LEVEL_THRESHOLD_FOR_PREEMPTION_ERRORS,
+        DEFAULT_LOG_LEVEL_THRESHOLD_FOR_PREEMPTION_ERRORS,
+    ),
+    CONF_RECENTLY_SET_POLL_IGNORE_WINDOW_S: (
+        MIN_RECENTLY_SET_POLL_IGNORE_WINDOW_S,
+        MAX_RECENTLY_SET_POLL_IGNORE_WINDOW_S,
+        DEFAULT_RECENTLY_SET_POLL_IGNORE_WINDOW_S,
+    ),
+    CONF_FALLBACK_PING_INTERVAL: (
+        MIN_FALLBACK_PING_INTERVAL,
+        MAX_FALLBACK_PING_INTERVAL,
+        DEFAULT_FALLBACK_PING_INTERVAL,
+    ),
+    CONF_ADAPTIVE_POLLING_MIN_FACTOR: (
+        MIN_ADAPTIVE_POLLING_MIN_FACTOR,
+        MAX_ADAPTIVE_POLLING_MIN_FACTOR,
+        DEFAULT_ADAPTIVE_POLLING_MIN_FACTOR,
+    ),
+    CONF_ADAPTIVE_POLLING_MAX_FACTOR: (
+        MIN_ADAPTIVE_POLLING_MAX_FACTOR,
+        MAX_ADAPTIVE_POLLING_MAX_FACTOR,
+        DEFAULT_ADAPTIVE_POLLING_MAX_FACTOR,
+    ),
+}
+assert all(
+    min_val <= default <= max_val
+    for min_val, max_val, default in NUMERIC_OPTION_BOUNDS.values()
+), "NUMERIC_OPTION_BOUNDS contains a default outside its range."
+
 # Other
 DEFAULT_SOURCE_TIMEZONE: Final[str] = "Europe/Berlin"
 
@@ -183,14 +295,32 @@ API_ENDPOINT_SET_VALUE: Final[str] = "/ActionManager.php?action=set_value_change
 
 # API Payloads & Request Types
 CONFIG_FLOW_TEST_PAYLOAD: Final[str] = "nodes=1T-2T-3T-4T"
+# Pre-encoded form sent as the request body, so it is not re-encoded per call.
+CONFIG_FLOW_TEST_PAYLOAD_BYTES: Final[bytes] = CONFIG_FLOW_TEST_PAYLOAD.encode("ascii")
 API_REQUEST_TYPE_SET_NODE_VALUE: Final[str] = "set_node_value"
+# Upper bound on the nodes combined into one dataRefresh request when several
+# polling groups are due in the same cycle.
+POLLING_BATCH_MAX_NODES: Final[int] = 100
+# Upper bound on polling requests in flight at once.
+POLLING_MAX_CONCURRENT_REQUESTS: Final[int] = 5
+# Added to the time until the next group is due when scheduling the next cycle.
+# Home Assistant truncates the refresh time to whole seconds, which could
+# otherwise wake the coordinator just before the group is due.
+POLLING_WAKE_SLACK_S: Final[float] = 1.0
 API_REQUEST_TYPE_GET_NODES_DATA: Final[str] = "get_nodes_data"
 
 # API Data Interpretation
-ACCEPTED_CONTENT_TYPES: Final[set[str]] = {"application/json", "text/plain"}
-HDG_UNAVAILABLE_STRINGS: Final[set[str]] = {"---", "unavailable", "none", "n/a"}
+ACCEPTED_CONTENT_TYPES: Final[frozenset[str]] = frozenset(
+    {"application/json", "text/plain"}
+)
+# Entries are lowercase; consumers compare against the lowercased API value.
+HDG_UNAVAILABLE_STRINGS: Final[frozenset[str]] = frozenset(
+    {"---", "unavailable", "none", "n/a"}
+)
 HDG_DATETIME_SPECIAL_TEXT: Final[str] = "größer 7 tage"
-KNOWN_HDG_API_SETTER_SUFFIXES: Final[set[str]] = {"T", "U", "V", "W", "X", "Y"}
+KNOWN_HDG_API_SETTER_SUFFIXES: Final[frozenset[str]] = frozenset(
+    {"T", "U", "V", "W", "X", "Y"}
+)
 
 
 # --------------------------------------------------------------------------------
@@ -198,8 +328,9 @@ KNOWN_HDG_API_SETTER_SUFFIXES: Final[set[str]] = {"T", "U", "V", "W", "X", "Y"}
 # --------------------------------------------------------------------------------
 # Timing & Delays
 INITIAL_REFRESH_API_TIMEOUT_OVERRIDE: Final[float] = 30.0
+# Upper bound on the whole first refresh during setup; on expiry setup is retried.
+INITIAL_REFRESH_TIMEOUT_S: Final[float] = 120.0
 POST_INITIAL_REFRESH_COOLDOWN_S: Final[float] = 5.0
-INITIAL_SEQUENTIAL_INTER_GROUP_DELAY_S: Final[float] = 0.5
 SET_NODE_COOLDOWN_S: Final[float] = 2.0
 DEFAULT_SET_VALUE_DEBOUNCE_DELAY_S: Final[float] = 2.0
 
@@ -210,13 +341,37 @@ MAX_SCAN_INTERVAL: Final[int] = 86430
 # Fallback & Retry Mechanisms
 COORDINATOR_FALLBACK_UPDATE_INTERVAL_MINUTES: Final[int] = 5
 COORDINATOR_MAX_CONSECUTIVE_FAILURES_BEFORE_FALLBACK: Final[int] = 3
-FALLBACK_PING_INTERVAL_S: Final[int] = 30
+# Kept for compatibility; the configurable default is the single source.
+FALLBACK_PING_INTERVAL_S: Final[int] = DEFAULT_FALLBACK_PING_INTERVAL
 POLLING_RETRY_INITIAL_DELAY_S: Final[float] = 60.0
 POLLING_RETRY_MAX_DELAY_S: Final[float] = 300.0
 POLLING_RETRY_BACKOFF_FACTOR: Final[float] = 2.0
 POLLING_RETRY_MAX_ATTEMPTS: Final[int] = 5
+# Delay before each polling retry attempt, derived once from the values above.
+# Attempts beyond the schedule reuse its last entry.
+POLLING_RETRY_SCHEDULE_S: Final[tuple[float, ...]] = tuple(
+    min(
+        POLLING_RETRY_INITIAL_DELAY_S * POLLING_RETRY_BACKOFF_FACTOR**attempt,
+        POLLING_RETRY_MAX_DELAY_S,
+    )
+    for attempt in range(POLLING_RETRY_MAX_ATTEMPTS)
+)
 SET_VALUE_RETRY_ATTEMPTS: Final[int] = 3
 SET_VALUE_RETRY_DELAY_S: Final[float] = 2.0
+# Token bucket for low-priority (regular polling) requests: a sustained rate and
+# the number of requests that may go out back to back before it applies.
+LOW_PRIORITY_REQUEST_RATE_PER_S: Final[float] = 2.0
+LOW_PRIORITY_REQUEST_BURST: Final[int] = 3
+
+# Persisted polling state (last poll times and values), so that a restart does
+# not re-poll groups that are still fresh. The entry ID is appended to the key.
+POLLING_STATE_STORAGE_KEY: Final[str] = f"{DOMAIN}.polling_state"
+POLLING_STATE_STORAGE_VERSION: Final[int] = 1
+POLLING_STATE_SAVE_DELAY_S: Final[float] = 30.0
+
+# Minimum time between full tracebacks for unexpected polling errors; repeats
+# within the interval are logged as a single line.
+UNEXPECTED_ERROR_TRACEBACK_INTERVAL_S: Final[float] = 300.0
 
 
 # --------------------------------------------------------------------------------
@@ -231,34 +386,74 @@ ATTR_VALUE: Final[str] = "value"
 # --------------------------------------------------------------------------------
 # Logging
 # --------------------------------------------------------------------------------
-LOG_LEVELS: Final[list[str]] = ["DEBUG", "INFO", "WARNING", "ERROR"]
-LIFECYCLE_LOGGER_NAME: Final[str] = f"{DOMAIN}.lifecycle"
-ENTITY_DETAIL_LOGGER_NAME: Final[str] = f"{DOMAIN}.entity_detail"
-API_LOGGER_NAME: Final[str] = f"{DOMAIN}.api"
-HEURISTICS_LOGGER_NAME: Final[str] = f"{DOMAIN}.heuristics"
-PROCESSOR_LOGGER_NAME: Final[str] = f"{DOMAIN}.processor"
-USER_ACTION_LOGGER_NAME: Final[str] = f"{DOMAIN}.user_action"
+LOG_LEVELS: Final[Mapping[str, int]] = MappingProxyType(
+    {
+        "DEBUG": logging.DEBUG,
+        "INFO": logging.INFO,
+        "WARNING": logging.WARNING,
+        "ERROR": logging.ERROR,
+    }
+)
+LOG_LEVEL_NAMES: Final[tuple[str, ...]] = tuple(LOG_LEVELS)
+# Child loggers of DOMAIN, spelled out as literals; keep in sync with DOMAIN.
+LIFECYCLE_LOGGER_NAME: Final[str] = "hdg_boiler.lifecycle"
+ENTITY_DETAIL_LOGGER_NAME: Final[str] = "hdg_boiler.entity_detail"
+API_LOGGER_NAME: Final[str] = "hdg_boiler.api"
+HEURISTICS_LOGGER_NAME: Final[str] = "hdg_boiler.heuristics"
+PROCESSOR_LOGGER_NAME: Final[str] = "hdg_boiler.processor"
+USER_ACTION_LOGGER_NAME: Final[str] = "hdg_boiler.user_action"
+assert all(
+    name.startswith(f"{DOMAIN}.")
+    for name in (
+        LIFECYCLE_LOGGER_NAME,
+        ENTITY_DETAIL_LOGGER_NAME,
+        API_LOGGER_NAME,
+        HEURISTICS_LOGGER_NAME,
+        PROCESSOR_LOGGER_NAME,
+        USER_ACTION_LOGGER_NAME,
+    )
+), "Logger names must be children of DOMAIN."
 
 
 # --------------------------------------------------------------------------------
 # Diagnostics
 # --------------------------------------------------------------------------------
-DIAGNOSTICS_TO_REDACT_CONFIG_KEYS: Final[set[str]] = {CONF_HOST_IP}
-DIAGNOSTICS_SENSITIVE_COORDINATOR_DATA_NODE_IDS: Final[set[str]] = {
-    "20026",
-    "20031",
-    "20039",
-}
+DIAGNOSTICS_TO_REDACT_CONFIG_KEYS: Final[frozenset[str]] = frozenset({CONF_HOST_IP})
+DIAGNOSTICS_SENSITIVE_COORDINATOR_DATA_NODE_IDS: Final[frozenset[str]] = frozenset(
+    {"20026", "20031", "20039"}
+)
 DIAGNOSTICS_REDACTED_PLACEHOLDER: Final[str] = "REDACTED"
 
 
 # --------------------------------------------------------------------------------
 # Static Definitions
 # --------------------------------------------------------------------------------
-POLLING_GROUP_DEFINITIONS: Final[list[PollingGroupStaticDefinition]] = [
-    {"key": "group_1", "default_interval": 15},
-    {"key": "group_2", "default_interval": 304},
-    {"key": "group_3", "default_interval": 86410},
-    {"key": "group_4", "default_interval": 86420},
-    {"key": "group_5", "default_interval": 86430},
-]
+POLLING_GROUP_DEFINITIONS: Final[tuple[PollingGroupStaticDefinition, ...]] = (
+    PollingGroupStaticDefinition(key="group_1", default_interval=15),
+    PollingGroupStaticDefinition(key="group_2", default_interval=304),
+    PollingGroupStaticDefinition(key="group_3", default_interval=86410),
+    PollingGroupStaticDefinition(key="group_4", default_interval=86420),
+    PollingGroupStaticDefinition(key="group_5", default_interval=86430),
+)
+# Column views of POLLING_GROUP_DEFINITIONS, index-aligned with each other.
+POLLING_GROUP_STATIC_KEYS: Final[tuple[str, ...]] = tuple(
+    group.key for group in POLLING_GROUP_DEFINITIONS
+)
+POLLING_GROUP_DEFAULT_INTERVALS: Final[tuple[int, ...]] = tuple(
+    group.default_interval for group in POLLING_GROUP_DEFINITIONS
+)
+POLLING_GROUP_SCAN_INTERVAL_KEYS: Final[tuple[str, ...]] = tuple(
+    f"{CONF_SCAN_INTERVAL}_{group_key}" for group_key in POLLING_GROUP_STATIC_KEYS
+)
+
+
+@cache
+def get_sensor_definitions() -> Mapping[str, SensorDefinition]:
+    """Return `SENSOR_DEFINITIONS`, importing the definitions module on first use.
+
+    The definitions table is only needed once a config entry is set up, so it is
+    kept out of the import path of this module (config flow, diagnostics).
+    """
+    from .definitions import SENSOR_DEFINITIONS
+
+    return SENSOR_DEFINITIONS
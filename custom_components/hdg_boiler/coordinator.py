@@ -2,67 +2,94 @@
 
 from __future__ import annotations
 
-__version__ = "0.3.6"
-__all__ = ["HdgDataUpdateCoordinator", "async_create_and_refresh_coordinator"]
+__version__ = "0.4.35"
+__all__ = [
+    "HdgDataUpdateCoordinator",
+    "async_create_and_refresh_coordinator",
+    "async_remove_polling_state",
+]
 
 import asyncio
+import contextlib
 import functools
 import logging
 import time
+from collections.abc import Awaitable, Mapping
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Any, TypedDict
+from typing import Any, Final, TypedDict
 from urllib.parse import urlparse
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.event import (
     async_call_later,
     async_track_time_interval,
 )
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import HdgApiClient
 from .classes.polling_response_processor import HdgPollingResponseProcessor
 from .const import (
+    ADAPTIVE_POLLING_EWMA_ALPHA,
+    ADAPTIVE_POLLING_TARGET_CHANGE_RATE,
     API_REQUEST_TYPE_GET_NODES_DATA,
     API_REQUEST_TYPE_SET_NODE_VALUE,
+    CONF_ADAPTIVE_POLLING_MAX_FACTOR,
+    CONF_ADAPTIVE_POLLING_MIN_FACTOR,
     CONF_FALLBACK_PING_INTERVAL,
     CONF_LOG_LEVEL_THRESHOLD_FOR_PREEMPTION_ERRORS,
     COORDINATOR_FALLBACK_UPDATE_INTERVAL_MINUTES,
     COORDINATOR_MAX_CONSECUTIVE_FAILURES_BEFORE_FALLBACK,
     DEFAULT_FALLBACK_PING_INTERVAL,
-    DEFAULT_LOG_LEVEL_THRESHOLD_FOR_PREEMPTION_ERRORS,
     DOMAIN,
-    MAX_FALLBACK_PING_INTERVAL,
-    MIN_FALLBACK_PING_INTERVAL,
+    INITIAL_REFRESH_TIMEOUT_S,
+    MAX_SCAN_INTERVAL,
     MIN_SCAN_INTERVAL,
-    POLLING_RETRY_BACKOFF_FACTOR,
-    POLLING_RETRY_INITIAL_DELAY_S,
+    POLLING_BATCH_MAX_NODES,
+    POLLING_GROUP_DEFAULT_INTERVALS,
+    POLLING_GROUP_SCAN_INTERVAL_KEYS,
+    POLLING_GROUP_STATIC_KEYS,
+    POLLING_MAX_CONCURRENT_REQUESTS,
     POLLING_RETRY_MAX_ATTEMPTS,
-    POLLING_RETRY_MAX_DELAY_S,
+    POLLING_RETRY_SCHEDULE_S,
+    POLLING_STATE_SAVE_DELAY_S,
+    POLLING_STATE_STORAGE_KEY,
+    POLLING_STATE_STORAGE_VERSION,
+    POLLING_WAKE_SLACK_S,
     POST_INITIAL_REFRESH_COOLDOWN_S,
+    UNEXPECTED_ERROR_TRACEBACK_INTERVAL_S,
 )
 from .exceptions import (
     HdgApiConnectionError,
     HdgApiError,
-    HdgApiResponseError,
     HdgApiPreemptedError,
 )
-from .helpers.api_access_manager import ApiPriority, HdgApiAccessManager
+from .helpers.api_access_manager import ApiPriority, HdgApiAccessManager, RequestSpec
 from .helpers.logging_utils import (
     _LIFECYCLE_LOGGER,
     _LOGGER,
     _USER_ACTION_LOGGER,
 )
 from .helpers.network_utils import async_execute_icmp_ping
+from .helpers.parsers import format_value_for_api
+from .helpers.string_utils import strip_hdg_node_suffix
+from .helpers.validation_utils import get_bounded_option
 from .registry import HdgEntityRegistry
 
+# Value types that survive a JSON round trip unchanged; groups holding anything
+# else (e.g. parsed datetimes) are not restored from storage.
+_PERSISTABLE_VALUE_TYPES: Final = frozenset({str, int, float, bool})
 
-class RetryInfo(TypedDict):
+
+@dataclass(slots=True)
+class RetryInfo:
     """Information for tracking retries for a failed polling group."""
 
-    attempts: int
-    next_retry_time: float
+    attempts: int = 0
+    next_retry_time: float = 0.0
 
 
 class PollingState(TypedDict):
@@ -74,7 +101,13 @@ class PollingState(TypedDict):
     failed_group_retry_info: dict[str, RetryInfo]
     last_update_times: dict[str, float]
     boiler_is_online: bool
-    boiler_online_event: asyncio.Event
+
+
+class PersistedPollingState(TypedDict):
+    """Polling state kept across restarts."""
+
+    last_update_times: dict[str, float]  # Wall-clock (epoch) timestamps.
+    data: dict[str, Any]
 
 
 class SetterState(TypedDict):
@@ -87,6 +120,7 @@ class SetterState(TypedDict):
     current_generations: dict[str, int]
     locks: dict[str, asyncio.Lock]
     initial_values: dict[str, Any]
+    in_flight_writes: dict[str, tuple[str, asyncio.Future[bool]]]
 
 
 class HdgDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
@@ -115,11 +149,49 @@ class HdgDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         self._initialize_state()
         self._validate_polling_config()
+        # Node lists are static per polling group; resolve them once so due
+        # groups can be combined into batched requests.
+        payloads = hdg_entity_registry.get_polling_group_payloads()
+        self._group_node_params: dict[str, bytes] = {
+            group_key: payload["payload_str"].removeprefix("nodes=").encode("ascii")
+            for group_key, payload in payloads.items()
+        }
+        self._group_node_counts: dict[str, int] = {
+            group_key: len(payload["nodes"]) for group_key, payload in payloads.items()
+        }
+        self._group_base_node_ids: dict[str, frozenset[str]] = {
+            group_key: frozenset(map(strip_hdg_node_suffix, payload["nodes"]))
+            for group_key, payload in payloads.items()
+        }
+        self._batch_payloads: dict[tuple[str, ...], bytes] = {}
         self.scan_intervals = self._initialize_scan_intervals()
-        shortest_interval = (
-            min(self.scan_intervals.values())
-            if self.scan_intervals
-            else timedelta(seconds=60)
+        # Adaptive polling: each group's effective interval is its configured one,
+        # scaled by how often its values have recently changed.
+        self._adaptive_min_factor = get_bounded_option(
+            entry.options, CONF_ADAPTIVE_POLLING_MIN_FACTOR
+        )
+        self._adaptive_max_factor = get_bounded_option(
+            entry.options, CONF_ADAPTIVE_POLLING_MAX_FACTOR
+        )
+        self._change_rates: dict[str, float] = dict.fromkeys(
+            self.scan_intervals, ADAPTIVE_POLLING_TARGET_CHANGE_RATE
+        )
+        # Option changes reload the entry, so these are read once here rather
+        # than on every cycle or failure.
+        self._preemption_log_threshold = get_bounded_option(
+            entry.options, CONF_LOG_LEVEL_THRESHOLD_FOR_PREEMPTION_ERRORS
+        )
+        # A configured interval of 0 disables the fallback ping.
+        self._fallback_ping_interval: float | None = (
+            get_bounded_option(entry.options, CONF_FALLBACK_PING_INTERVAL)
+            if entry.options.get(
+                CONF_FALLBACK_PING_INTERVAL, DEFAULT_FALLBACK_PING_INTERVAL
+            )
+            else None
+        )
+        self._effective_intervals: dict[str, float] = dict(self.scan_intervals)
+        shortest_interval = timedelta(
+            seconds=min(self.scan_intervals.values(), default=60.0)
         )
 
         super().__init__(
@@ -127,17 +199,35 @@ class HdgDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER,
             name=f"{DOMAIN} ({self.entry.title})",
             update_interval=shortest_interval,
+            # Listeners are only notified when a polled value actually changed;
+            # see the copy-on-write in `_async_update_data`.
+            always_update=False,
+        )
+        # Every polled node gets its slot up front, so the dict is sized once
+        # instead of growing (and rehashing) while the first refresh fills it.
+        # Readers use `.get()`, so a None placeholder reads like a missing key.
+        self.data: dict[str, Any] = dict.fromkeys(
+            node_id
+            for node_ids in self._group_base_node_ids.values()
+            for node_id in node_ids
         )
-        self.data: dict[str, Any] = {}
 
         self._original_update_interval = self.update_interval
+        self._shortest_interval_s = shortest_interval.total_seconds()
+        self._fallback_active = False
         self._fallback_update_interval = timedelta(
             minutes=COORDINATOR_FALLBACK_UPDATE_INTERVAL_MINUTES
         )
         self._polling_response_processor = HdgPollingResponseProcessor(self)
 
         self._hostname = urlparse(self.api_client.base_url).hostname
+        # Monotonic time before which no polling cycle may start; set after the
+        # initial refresh to give the boiler a short rest.
+        self._polling_cooldown_until = 0.0
+        self._store = _create_polling_state_store(hass, entry.entry_id)
+        self._last_traceback_logged: float | None = None
         self._ping_unsub: CALLBACK_TYPE | None = None
+        self._listener_update_handle: asyncio.Handle | None = None
 
         _LOGGER.debug(
             "HdgDataUpdateCoordinator initialized. Update interval: %s",
@@ -155,9 +245,7 @@ class HdgDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 self.hdg_entity_registry.get_polling_group_order(), 0.0
             ),
             "boiler_is_online": True,
-            "boiler_online_event": asyncio.Event(),
         }
-        self._polling_state["boiler_online_event"].set()
 
         self._setter_state: SetterState = {
             "last_set_times": {},
@@ -167,6 +255,7 @@ class HdgDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             "current_generations": {},
             "locks": {},
             "initial_values": {},
+            "in_flight_writes": {},
         }
 
     def _set_boiler_online_status(self, is_online: bool) -> None:
@@ -177,26 +266,25 @@ class HdgDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 "ONLINE" if is_online else "OFFLINE",
             )
             self._polling_state["boiler_is_online"] = is_online
-            if is_online:
-                self._polling_state["boiler_online_event"].set()
-            else:
-                self._polling_state["boiler_online_event"].clear()
 
-    def _initialize_scan_intervals(self) -> dict[str, timedelta]:
-        """Initialize scan intervals for each polling group."""
-        scan_intervals: dict[str, timedelta] = {}
+    def _initialize_scan_intervals(self) -> dict[str, float]:
+        """Initialize scan intervals, in seconds, for each polling group."""
+        scan_intervals: dict[str, float] = {}
         current_config = self.entry.options or self.entry.data
-        for (
-            group_key,
-            payload,
-        ) in self.hdg_entity_registry.get_polling_group_payloads().items():
-            config_key = f"scan_interval_{group_key}"
-            default_val = float(payload["default_scan_interval"])
+        payloads = self.hdg_entity_registry.get_polling_group_payloads()
+        for group_key, config_key, default_interval in zip(
+            POLLING_GROUP_STATIC_KEYS,
+            POLLING_GROUP_SCAN_INTERVAL_KEYS,
+            POLLING_GROUP_DEFAULT_INTERVALS,
+        ):
+            if group_key not in payloads:
+                continue
+            default_val = float(default_interval)
             try:
                 raw_val = max(float(current_config.get(config_key)), MIN_SCAN_INTERVAL)
             except (ValueError, TypeError):
                 raw_val = default_val
-            scan_intervals[group_key] = timedelta(seconds=raw_val)
+            scan_intervals[group_key] = raw_val
         return scan_intervals
 
     def _validate_polling_config(self) -> None:
@@ -206,6 +294,14 @@ class HdgDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         ):
             raise ValueError("Polling group order and payload keys mismatch.")
 
+    @property
+    def polling_state(self) -> PollingState:
+        """Return the polling state for diagnostics; callers must not modify it.
+
+        Poll and retry times in it are `time.monotonic()` timestamps.
+        """
+        return self._polling_state
+
     @property
     def last_update_times_public(self) -> dict[str, float]:
         """Return last successful update times for polling groups."""
@@ -216,92 +312,303 @@ class HdgDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Return True if the boiler is considered online."""
         return self._polling_state["boiler_is_online"]
 
+    def _build_batches(self, group_keys: list[str]) -> list[tuple[str, ...]]:
+        """Combine polling groups into batches of at most `POLLING_BATCH_MAX_NODES`.
+
+        A group larger than the limit on its own still forms a single batch.
+        """
+        batches: list[tuple[str, ...]] = []
+        batch: list[str] = []
+        batch_nodes = 0
+        for group_key in group_keys:
+            group_nodes = self._group_node_counts[group_key]
+            if batch and batch_nodes + group_nodes > POLLING_BATCH_MAX_NODES:
+                batches.append(tuple(batch))
+                batch, batch_nodes = [], 0
+            batch.append(group_key)
+            batch_nodes += group_nodes
+        if batch:
+            batches.append(tuple(batch))
+        return batches
+
+    def _update_change_rate(self, group_key: str, changed_fraction: float) -> None:
+        """Update a group's change rate and derive its effective scan interval.
+
+        The change rate is an exponential moving average of the fraction of the
+        group's nodes whose value changed in a poll, so a single fluctuating
+        temperature does not mark a large group as busy. Groups changing more
+        often than the target rate are polled faster than configured, quieter
+        groups slower, within the configured factor range and the global scan
+        interval limits.
+        """
+        if group_key not in self._change_rates:
+            return
+        rate = self._change_rates[group_key]
+        rate += ADAPTIVE_POLLING_EWMA_ALPHA * (changed_fraction - rate)
+        self._change_rates[group_key] = rate
+        factor = min(
+            max(
+                ADAPTIVE_POLLING_TARGET_CHANGE_RATE / max(rate, 1e-3),
+                self._adaptive_min_factor,
+            ),
+            self._adaptive_max_factor,
+        )
+        self._effective_intervals[group_key] = min(
+            max(
+                self.scan_intervals[group_key] * factor,
+                MIN_SCAN_INTERVAL,
+            ),
+            MAX_SCAN_INTERVAL,
+        )
+
+    def _reset_adaptive_interval(self, node_id: str) -> None:
+        """Return the groups polling `node_id` to their configured interval.
+
+        A write can make a quiet group change again, e.g. dependent values
+        following a new setpoint; its stretched interval would hide that.
+        """
+        for group_key, node_ids in self._group_base_node_ids.items():
+            if node_id in node_ids:
+                self._change_rates[group_key] = ADAPTIVE_POLLING_TARGET_CHANGE_RATE
+                self._effective_intervals[group_key] = self.scan_intervals[group_key]
+
+    def _get_batch_payload(self, group_keys: tuple[str, ...]) -> bytes:
+        """Return the request payload for a batch, building it on first use."""
+        if (payload := self._batch_payloads.get(group_keys)) is None:
+            payload = b"nodes=" + b"-".join(
+                self._group_node_params[group_key] for group_key in group_keys
+            )
+            self._batch_payloads[group_keys] = payload
+        return payload
+
+    def _batch_request_spec(
+        self, group_keys: tuple[str, ...], priority: ApiPriority
+    ) -> RequestSpec:
+        """Describe the dataRefresh request for a batch of polling groups."""
+        return RequestSpec(
+            priority=priority,
+            coroutine=self.api_client.async_get_nodes_data,
+            request_type=API_REQUEST_TYPE_GET_NODES_DATA,
+            context_key="+".join(group_keys),
+            kwargs={"node_payload_str": self._get_batch_payload(group_keys)},
+        )
+
     async def _fetch_group_data(
-        self, group_key: str, payload_str: str, priority: ApiPriority
-    ) -> bool:
-        """Fetch and process data for a single polling group."""
+        self, group_keys: tuple[str, ...], request: Awaitable[Any]
+    ) -> list[str] | None:
+        """Await the submitted request for a batch of groups and process it.
+
+        Returns:
+            The groups of the batch whose nodes all came back in the response,
+            or None if the request failed.
+
+        """
+        group_key = "+".join(group_keys)
         try:
-            fetched_data = await self.api_access_manager.submit_request(
-                priority=priority,
-                coroutine=self.api_client.async_get_nodes_data,
-                request_type=API_REQUEST_TYPE_GET_NODES_DATA,
-                context_key=group_key,
-                node_payload_str=payload_str,
-            )
-            if fetched_data is not None:
+            fetched_data = await request
+            if fetched_data is None:
+                return None
+            received_ids, changed_ids = (
                 self._polling_response_processor.process_api_items(
                     group_key, fetched_data
                 )
-                self._polling_state["consecutive_preemption_failures"] = 0
-                return True
-            return False
-        except HdgApiPreemptedError as err:
-            self._polling_state["consecutive_preemption_failures"] += 1
-            threshold = self.entry.options.get(
-                CONF_LOG_LEVEL_THRESHOLD_FOR_PREEMPTION_ERRORS,
-                DEFAULT_LOG_LEVEL_THRESHOLD_FOR_PREEMPTION_ERRORS,
             )
-            if self._polling_state["consecutive_preemption_failures"] >= threshold:
-                _LOGGER.warning("Fetch for group '%s' preempted: %s", group_key, err)
-            else:
-                _LOGGER.info("Fetch for group '%s' preempted: %s", group_key, err)
-            return False
-        except HdgApiConnectionError:
-            raise
-        except (HdgApiResponseError, HdgApiError) as err:
-            _LOGGER.warning("API error fetching group '%s': %s", group_key, err)
-            return False
-        except Exception:
-            _LOGGER.exception("Unexpected error polling group '%s'.", group_key)
-            raise
-
-    async def _sequentially_fetch_groups(
-        self, groups: list[tuple[str, str]], priority: ApiPriority
-    ) -> bool:
-        """Fetch data for multiple polling groups concurrently with a limit."""
-        semaphore = asyncio.Semaphore(5)  # Limit to 5 concurrent requests
-
-        async def fetch_with_semaphore(
-            group_key: str, payload_str: str
-        ) -> tuple[str, bool]:
-            async with semaphore:
-                try:
-                    success = await self._fetch_group_data(
-                        group_key, payload_str, priority
+            complete_groups: list[str] = []
+            last_update = self._polling_state["last_update_times"].get
+            group_base_node_ids = self._group_base_node_ids
+            for key in group_keys:
+                node_ids = group_base_node_ids[key]
+                if not node_ids <= received_ids:
+                    _LOGGER.debug(
+                        "Response for group '%s' lacks %d of its nodes.",
+                        key,
+                        len(node_ids - received_ids),
                     )
-                    return group_key, success
-                except HdgApiConnectionError:
-                    raise  # Re-raise to be caught by the gather call
-                except Exception:
-                    _LOGGER.exception(
-                        "Unhandled exception fetching group '%s'.", group_key
+                    continue
+                complete_groups.append(key)
+                # The first poll of a group populates it; that says nothing
+                # about how often its values change.
+                if last_update(key, 0.0) > 0 and node_ids:
+                    self._update_change_rate(
+                        key, len(node_ids & changed_ids) / len(node_ids)
                     )
-                    return group_key, False
+            self._polling_state["consecutive_preemption_failures"] = 0
+            return complete_groups
+        except HdgApiError as err:
+            match err:
+                case HdgApiConnectionError():
+                    raise
+                case HdgApiPreemptedError():
+                    self._polling_state["consecutive_preemption_failures"] += 1
+                    _LOGGER.log(
+                        logging.WARNING
+                        if self._polling_state["consecutive_preemption_failures"]
+                        >= self._preemption_log_threshold
+                        else logging.INFO,
+                        "Fetch for group '%s' preempted: %s",
+                        group_key,
+                        err,
+                    )
+                case _:
+                    _LOGGER.warning("API error fetching group '%s': %s", group_key, err)
+            return None
 
-        tasks = [fetch_with_semaphore(gk, ps) for gk, ps in groups]
-        try:
-            results = await asyncio.gather(*tasks)
-        except HdgApiConnectionError:
-            raise  # Propagate the connection error to the caller
+    def _log_unexpected_fetch_error(
+        self, group_keys: tuple[str, ...], err: Exception
+    ) -> None:
+        """Log an unexpected polling error, with a traceback only now and then.
+
+        A misbehaving boiler can trigger the same error on every cycle; formatting
+        the traceback each time is costly and floods the log.
+        """
+        now = time.monotonic()
+        last_logged = self._last_traceback_logged
+        if (
+            last_logged is None
+            or now - last_logged >= UNEXPECTED_ERROR_TRACEBACK_INTERVAL_S
+        ):
+            self._last_traceback_logged = now
+            _LOGGER.exception("Unexpected error polling groups '%s'.", group_keys)
+        else:
+            _LOGGER.error(
+                "Unexpected error polling groups '%s': %r (traceback suppressed).",
+                group_keys,
+                err,
+            )
+
+    async def _batched_fetch_groups(
+        self, groups: list[str], priority: ApiPriority, cycle_now: float
+    ) -> bool:
+        """Fetch polling groups as concurrent batched requests.
 
-        any_success = any(r[1] for r in results)
+        The batches are handed to the API access manager in windows of at most
+        `POLLING_MAX_CONCURRENT_REQUESTS`, each window in one `submit_batch`
+        call; the manager queues and paces them. A limit of 1 fetches the
+        batches strictly one after another, e.g. for debugging. While the
+        boiler is considered offline the batches are also fetched one at a
+        time, so the first connection error ends the cycle without queueing
+        requests that would only fail the same way.
 
-        for group_key, success in results:
-            if success:
-                self._polling_state["last_update_times"][group_key] = time.monotonic()
+        Groups whose nodes all came back are stamped with `cycle_now`, the time
+        the cycle started, so their intervals run start-to-start without
+        drifting by the request duration. Groups missing from a partial
+        response stay due and are fetched again in the next cycle.
+
+        Returns:
+            True if any request of the cycle got a response.
+
+        """
+
+        async def fetch_batch(
+            group_keys: tuple[str, ...], request: Awaitable[Any]
+        ) -> list[str] | None:
+            try:
+                return await self._fetch_group_data(group_keys, request)
+            except HdgApiConnectionError:
+                raise  # Cancels the remaining batches via the task group
+            except Exception as err:
+                self._log_unexpected_fetch_error(group_keys, err)
+                return None
+
+        batches = self._build_batches(groups)
+        window_size = (
+            POLLING_MAX_CONCURRENT_REQUESTS
+            if self._polling_state["boiler_is_online"]
+            else 1
+        )
+        tasks: dict[tuple[str, ...], asyncio.Task[list[str] | None]] = {}
+        for start in range(0, len(batches), window_size):
+            window = batches[start : start + window_size]
+            requests = await self.api_access_manager.submit_batch(
+                [self._batch_request_spec(batch, priority) for batch in window]
+            )
+            # A connection error makes the other batches pointless; the task
+            # group cancels them and no further window is submitted.
+            try:
+                async with asyncio.TaskGroup() as task_group:
+                    for batch, request in zip(window, requests, strict=True):
+                        tasks[batch] = task_group.create_task(
+                            fetch_batch(batch, request)
+                        )
+            except* HdgApiConnectionError as err_group:
+                raise err_group.exceptions[0]
+
+        any_success = False
+        last_update_times = self._polling_state["last_update_times"]
+        for task in tasks.values():
+            if (complete_groups := task.result()) is not None:
+                any_success = True
+                for group_key in complete_groups:
+                    last_update_times[group_key] = cycle_now
+        if any_success:
+            self._store.async_delay_save(
+                self._polling_state_to_persist, POLLING_STATE_SAVE_DELAY_S
+            )
 
         return any_success
 
+    def _polling_state_to_persist(self) -> PersistedPollingState:
+        """Return poll times (as wall-clock) and JSON-safe values for storage."""
+        offset = time.time() - time.monotonic()
+        last_update_times = self._polling_state["last_update_times"]
+        return {
+            "last_update_times": {
+                group_key: polled_at + offset
+                for group_key, polled_at in last_update_times.items()
+                if polled_at > 0
+            },
+            "data": {
+                node_id: value
+                for node_id, value in self.data.items()
+                # Skips the None placeholders of nodes not polled yet.
+                if type(value) in _PERSISTABLE_VALUE_TYPES
+            },
+        }
+
+    async def async_restore_polling_state(self) -> None:
+        """Restore recently polled groups so the first refresh can skip them.
+
+        A group is restored only if its effective interval has not elapsed since
+        it was last polled and all of its values were persisted.
+        """
+        if not (stored := await self._store.async_load()):
+            return
+        stored_data = stored.get("data", {})
+        wall_now, mono_now = time.time(), time.monotonic()
+        last_update_times = self._polling_state["last_update_times"]
+        restored: list[str] = []
+        for group_key, polled_at in stored.get("last_update_times", {}).items():
+            node_ids = self._group_base_node_ids.get(group_key)
+            age = wall_now - polled_at
+            if (
+                node_ids is None
+                or not 0 <= age < self._effective_intervals.get(group_key, 0.0)
+                or mono_now - age <= 0
+                or not node_ids.issubset(stored_data)
+            ):
+                continue
+            for node_id in node_ids:
+                self.data[node_id] = stored_data[node_id]
+            last_update_times[group_key] = mono_now - age
+            restored.append(group_key)
+        if restored:
+            _LIFECYCLE_LOGGER.info(
+                "Restored recently polled groups %s; skipping them on startup.",
+                restored,
+            )
+
     async def async_config_entry_first_refresh(self) -> None:
-        """Perform initial sequential data refresh for all polling groups."""
+        """Perform the initial data refresh for all groups not restored."""
         _LIFECYCLE_LOGGER.info("Initiating first data refresh for %s.", self.name)
-        all_groups = [
-            (gk, p["payload_str"])
-            for gk, p in self.hdg_entity_registry.get_polling_group_payloads().items()
+        last_update_times = self._polling_state["last_update_times"]
+        groups = [
+            group_key
+            for group_key in self._group_node_params
+            if last_update_times.get(group_key, 0.0) == 0.0
         ]
         try:
-            any_success = await self._sequentially_fetch_groups(
-                all_groups, ApiPriority.MEDIUM
+            any_success = not groups or await self._batched_fetch_groups(
+                groups, ApiPriority.MEDIUM, time.monotonic()
             )
             if not any_success:
                 raise UpdateFailed(f"Initial data refresh failed for {self.name}.")
@@ -316,23 +623,26 @@ class HdgDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._set_boiler_online_status(True)
         _LIFECYCLE_LOGGER.info("First data refresh for %s complete.", self.name)
         self.async_set_updated_data(self.data)
-        await asyncio.sleep(POST_INITIAL_REFRESH_COOLDOWN_S)
+        self._polling_cooldown_until = (
+            time.monotonic() + POST_INITIAL_REFRESH_COOLDOWN_S
+        )
 
-    def _get_groups_to_fetch(self, current_time: float) -> dict[str, str]:
+    def _get_groups_to_fetch(self, current_time: float) -> list[str]:
         """Identify all polling groups that are due for an update or retry."""
-        payloads = self.hdg_entity_registry.get_polling_group_payloads()
-        due_groups = {
-            key: payloads[key]["payload_str"]
-            for key, interval in self.scan_intervals.items()
-            if (current_time - self._polling_state["last_update_times"].get(key, 0.0))
-            >= interval.total_seconds()
-        }
-        retry_groups = {
-            key: payloads[key]["payload_str"]
+        last_update = self._polling_state["last_update_times"].get
+        due_groups = [
+            key
+            for key, interval in self._effective_intervals.items()
+            if current_time - last_update(key, 0.0) >= interval
+        ]
+        # Only a handful of groups exist, so the membership test on the list
+        # is cheaper than building a set for it.
+        due_groups.extend(
+            key
             for key, info in self._polling_state["failed_group_retry_info"].items()
-            if current_time >= info["next_retry_time"]
-        }
-        return due_groups | retry_groups
+            if current_time >= info.next_retry_time and key not in due_groups
+        )
+        return due_groups
 
     def _get_log_level_for_failure(self) -> int:
         """Determine the appropriate log level based on consecutive failures."""
@@ -349,18 +659,29 @@ class HdgDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._polling_state["consecutive_failures"] = 0
         self._polling_state["consecutive_connection_failures"] = 0
         # Clear retry info for groups that have successfully updated.
-        for group_key in list(self._polling_state["failed_group_retry_info"]):
-            if self._polling_state["last_update_times"].get(group_key, 0.0) > 0:
-                del self._polling_state["failed_group_retry_info"][group_key]
-        if self.update_interval == self._fallback_update_interval:
+        if retry_info := self._polling_state["failed_group_retry_info"]:
+            last_update_times = self._polling_state["last_update_times"]
+            self._polling_state["failed_group_retry_info"] = {
+                group_key: info
+                for group_key, info in retry_info.items()
+                if last_update_times.get(group_key, 0.0) == 0.0
+            }
+        if self._fallback_active:
+            self._fallback_active = False
             self.update_interval = self._original_update_interval
             _LIFECYCLE_LOGGER.info(
                 "Polling successful. Restoring original interval: %s",
                 self.update_interval,
             )
 
-    def _update_polling_status(self, success: bool, groups_in_cycle: list[str]) -> None:
-        """Update polling status, manage failures, and schedule retries."""
+    def _update_polling_status(
+        self, success: bool, groups_in_cycle: list[str], cycle_now: float | None = None
+    ) -> None:
+        """Update polling status, manage failures, and schedule retries.
+
+        Retries are scheduled relative to `cycle_now`, the start of the cycle,
+        defaulting to the current time.
+        """
         if success:
             self._handle_successful_poll()
             return
@@ -377,34 +698,34 @@ class HdgDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         log_level_for_details = logging.DEBUG if failures >= threshold else logging.INFO
 
+        now = time.monotonic() if cycle_now is None else cycle_now
+        retry_info = self._polling_state["failed_group_retry_info"]
         for group_key in groups_in_cycle:
-            info = self._polling_state["failed_group_retry_info"].get(
-                group_key, {"attempts": 0, "next_retry_time": 0.0}
-            )
-            info["attempts"] += 1
-            delay = min(
-                POLLING_RETRY_INITIAL_DELAY_S
-                * (POLLING_RETRY_BACKOFF_FACTOR ** (info["attempts"] - 1)),
-                POLLING_RETRY_MAX_DELAY_S,
-            )
-            info["next_retry_time"] = time.monotonic() + delay
-            self._polling_state["failed_group_retry_info"][group_key] = info
+            info = retry_info.get(group_key)
+            if info is None:
+                info = retry_info[group_key] = RetryInfo()
+            info.attempts += 1
+            delay = POLLING_RETRY_SCHEDULE_S[
+                min(info.attempts, len(POLLING_RETRY_SCHEDULE_S)) - 1
+            ]
+            info.next_retry_time = now + delay
 
             _LOGGER.log(
                 log_level_for_details,
                 "Error for group '%s'. Attempt %s, next retry in %.0fs.",
                 group_key,
-                info["attempts"],
+                info.attempts,
                 delay,
             )
 
-            if info["attempts"] >= POLLING_RETRY_MAX_ATTEMPTS:
+            if info.attempts >= POLLING_RETRY_MAX_ATTEMPTS:
                 _LIFECYCLE_LOGGER.warning(
                     "Group '%s' reached max retry attempts.", group_key
                 )
 
         if failures >= COORDINATOR_MAX_CONSECUTIVE_FAILURES_BEFORE_FALLBACK:
-            if self.update_interval != self._fallback_update_interval:
+            if not self._fallback_active:
+                self._fallback_active = True
                 self.update_interval = self._fallback_update_interval
                 _LIFECYCLE_LOGGER.warning(
                     "Boiler offline. Switching to fallback interval: %s",
@@ -451,16 +772,33 @@ class HdgDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data for all due polling groups."""
-        groups_to_fetch = self._get_groups_to_fetch(time.monotonic())
+        now = time.monotonic()
+        # Only the remainder of the post-refresh cooldown is waited out; it has
+        # normally long elapsed by the first scheduled cycle.
+        if (wait := self._polling_cooldown_until - now) > 0:
+            await asyncio.sleep(wait)
+            now = time.monotonic()
+        try:
+            return await self._async_poll_due_groups(now)
+        finally:
+            self._schedule_next_cycle()
+
+    async def _async_poll_due_groups(self, now: float) -> dict[str, Any]:
+        """Fetch the groups due at `now` and update the polling status."""
+        groups_to_fetch = self._get_groups_to_fetch(now)
         if not groups_to_fetch:
             return self.data
 
+        # Write this cycle's values into a copy, leaving the previous dict intact
+        # so the base class can compare the two and skip notifying listeners
+        # when nothing changed.
+        self.data = dict(self.data)
         try:
-            any_success = await self._sequentially_fetch_groups(
-                list(groups_to_fetch.items()), ApiPriority.LOW
+            any_success = await self._batched_fetch_groups(
+                groups_to_fetch, ApiPriority.LOW, now
             )
             self._set_boiler_online_status(any_success)
-            self._update_polling_status(any_success, list(groups_to_fetch.keys()))
+            self._update_polling_status(any_success, groups_to_fetch, now)
 
         except HdgApiConnectionError as err:
             self._on_connection_failure()
@@ -470,25 +808,48 @@ class HdgDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         return self.data
 
+    def _schedule_next_cycle(self) -> None:
+        """Set `update_interval` so the next cycle starts when a group is due.
+
+        Home Assistant starts a cycle every `update_interval`. Instead of waking
+        at the shortest scan interval and often finding nothing due, the
+        coordinator sleeps until the earliest regular update or retry. Groups
+        still overdue after a cycle, e.g. because their fetch failed, are tried
+        again after the shortest scan interval, as before. While the boiler is
+        offline the fallback interval is left untouched.
+        """
+        if self._fallback_active:
+            return
+        now = time.monotonic()
+        last_update = self._polling_state["last_update_times"].get
+        due_times = [
+            last_update(key, 0.0) + interval
+            for key, interval in self._effective_intervals.items()
+        ]
+        due_times.extend(
+            info.next_retry_time
+            for info in self._polling_state["failed_group_retry_info"].values()
+        )
+        overdue_retry = now + self._shortest_interval_s
+        next_due = min(
+            (due if due > now else overdue_retry for due in due_times),
+            default=overdue_retry,
+        )
+        self.update_interval = timedelta(seconds=next_due - now + POLLING_WAKE_SLACK_S)
+
     async def async_set_node_value(
         self, node_id: str, value: str, entity_name_for_log: str, debounce_delay: float
     ) -> bool:
-        """Queue a node value to be set on the boiler with debouncing."""
-        if not isinstance(value, str):
-            raise TypeError(f"Value for {entity_name_for_log} must be a string.")
+        """Queue a node value to be set on the boiler with debouncing.
 
+        `value` must already be formatted for the API; the entities and the
+        service handler produce strings, so it is not checked again here.
+        """
         # If this is the first request in a potential sequence, store the initial value.
         if node_id not in self._setter_state["pending_timers"]:
             self._setter_state["initial_values"][node_id] = self.data.get(node_id)
 
-        generation = self._setter_state["current_generations"].get(node_id, 0) + 1
-        self._setter_state["current_generations"][node_id] = generation
-        self._setter_state["optimistic_values"][node_id] = value
-        self._setter_state["optimistic_times"][node_id] = time.monotonic()
-
-        if node_id in self._setter_state["pending_timers"]:
-            self._setter_state["pending_timers"].pop(node_id)()
-
+        generation = self._supersede_pending_set(node_id, value)
         job_target = functools.partial(
             self._process_debounced_set_value,
             node_id=node_id,
@@ -500,6 +861,24 @@ class HdgDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         )
         return True
 
+    def _supersede_pending_set(self, node_id: str, value: str) -> int:
+        """Make `value` the node's latest requested value and return its generation.
+
+        A pending debounce timer for the node is cancelled, and a debounced write
+        already waiting for the node's lock skips itself as stale.
+        """
+        setter_state = self._setter_state
+        generation = setter_state["current_generations"].get(node_id, 0) + 1
+        setter_state["current_generations"][node_id] = generation
+        setter_state["optimistic_values"][node_id] = value
+        setter_state["optimistic_times"][node_id] = time.monotonic()
+
+        if (
+            cancel_timer := setter_state["pending_timers"].pop(node_id, None)
+        ) is not None:
+            cancel_timer()
+        return generation
+
     def _should_skip_set_request(
         self, node_id: str, entity_name_for_log: str, scheduled_generation: int
     ) -> tuple[bool, str | None]:
@@ -528,21 +907,165 @@ class HdgDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # Compare final value to the value before the first change in the sequence.
         if final_value == initial_value:
             _USER_ACTION_LOGGER.info(
-                "Skipping set request for %s. Final value '%s' matches initial value.",
+                "Skipping set request for %s. Final value '%s' is already set.",
                 entity_name_for_log,
                 final_value,
             )
             self._setter_state["optimistic_values"].pop(node_id, None)
             self._setter_state["optimistic_times"].pop(node_id, None)
-            self.async_set_updated_data(self.data)
+            self._schedule_listener_update()
             return True, None
 
         return False, final_value
 
+    def _record_successful_set(self, node_id: str, value: str) -> None:
+        """Store a value the boiler acknowledged and note when it was set."""
+        self.data[node_id] = value
+        self._setter_state["last_set_times"][node_id] = time.monotonic()
+        self._reset_adaptive_interval(node_id)
+
+    def _is_value_already_set(self, node_id: str, value: str) -> bool:
+        """Return True if the node's current value equals the API-formatted `value`.
+
+        Polled numbers are stored parsed, so they are formatted with the node's
+        setter type before comparing.
+        """
+        if (current := self.data.get(node_id)) is None:
+            return False
+        if type(current) in (int, float):
+            registry = self.hdg_entity_registry
+            definition = registry.get_settable_number_definition_by_base_node_id(
+                node_id
+            )
+            if definition and (setter_type := definition.get("setter_type")):
+                current = format_value_for_api(current, setter_type)
+        return str(current) == value
+
+    async def async_set_multiple_nodes_if_changed(
+        self, values: Mapping[str, str]
+    ) -> dict[str, bool]:
+        """Set several node values at once, skipping those already set.
+
+        Unlike `async_set_node_value`, the writes are not debounced. They are
+        queued together through `submit_batch`, so the worker sends them back
+        to back. As with a single write, each value supersedes a pending
+        debounced one for its node, the node's lock serialises it with other
+        writes, and identical requests await it through `in_flight_writes`.
+        Values must already be formatted for the API.
+
+        Args:
+            values: API-formatted values keyed by base node ID.
+
+        Returns:
+            Whether each node now holds its requested value, keyed by node ID.
+            Nodes that already held it count as set without an API call.
+
+        """
+        setter_state = self._setter_state
+        for node_id, value in values.items():
+            self._supersede_pending_set(node_id, value)
+            setter_state["initial_values"].pop(node_id, None)
+
+        async with contextlib.AsyncExitStack() as stack:
+            # A fixed order keeps concurrent batches from deadlocking.
+            for node_id in sorted(values):
+                await stack.enter_async_context(
+                    setter_state["locks"].setdefault(node_id, asyncio.Lock())
+                )
+            results: dict[str, bool] = {}
+            to_set: list[tuple[str, str]] = []
+            for node_id, value in values.items():
+                if self._is_value_already_set(node_id, value):
+                    results[node_id] = True
+                    if setter_state["optimistic_values"].get(node_id) == value:
+                        setter_state["optimistic_values"].pop(node_id, None)
+                        setter_state["optimistic_times"].pop(node_id, None)
+                else:
+                    to_set.append((node_id, value))
+            if to_set:
+                results.update(await self._execute_set_batch(to_set))
+
+        _LOGGER.info(
+            "Set %d of %d node(s) in one batch; %d already held their value.",
+            sum(results[node_id] for node_id, _ in to_set),
+            len(to_set),
+            len(values) - len(to_set),
+        )
+        self._schedule_listener_update()
+        return results
+
+    async def _execute_set_batch(
+        self, to_set: list[tuple[str, str]]
+    ) -> dict[str, bool]:
+        """Send several writes through `submit_batch` and return their success.
+
+        The caller must hold the lock of every node in `to_set`.
+        """
+        futures = {
+            node_id: self._start_set_request(node_id, value)
+            for node_id, value in to_set
+        }
+        results = dict.fromkeys(futures, False)
+        try:
+            request_futures = await self.api_access_manager.submit_batch(
+                [
+                    RequestSpec(
+                        priority=ApiPriority.HIGH,
+                        coroutine=self.api_client.async_set_node_value,
+                        request_type=API_REQUEST_TYPE_SET_NODE_VALUE,
+                        context_key=node_id,
+                        kwargs={"node_id": node_id, "value": value},
+                    )
+                    for node_id, value in to_set
+                ]
+            )
+            outcomes = await asyncio.gather(*request_futures, return_exceptions=True)
+            for (node_id, value), outcome in zip(to_set, outcomes, strict=True):
+                if outcome is True:
+                    results[node_id] = True
+                    self._record_successful_set(node_id, value)
+                elif isinstance(outcome, BaseException):
+                    _LOGGER.error("API error setting %s: %s", node_id, outcome)
+                else:
+                    _LOGGER.error(
+                        "Failed to set %s to '%s'. API call returned False.",
+                        node_id,
+                        value,
+                    )
+        finally:
+            for node_id, future in futures.items():
+                self._finish_set_request(node_id, future, results[node_id])
+        return results
+
+    def _start_set_request(self, node_id: str, value: str) -> asyncio.Future[bool]:
+        """Register a write in `in_flight_writes` and return its outcome future."""
+        future: asyncio.Future[bool] = self.hass.loop.create_future()
+        self._setter_state["in_flight_writes"][node_id] = (value, future)
+        return future
+
+    def _finish_set_request(
+        self, node_id: str, future: asyncio.Future[bool], success: bool
+    ) -> None:
+        """Resolve a write registered by `_start_set_request` and notify listeners."""
+        del self._setter_state["in_flight_writes"][node_id]
+        future.set_result(success)
+        if self.data.get(node_id) == self._setter_state["optimistic_values"].get(
+            node_id
+        ):
+            self._setter_state["optimistic_values"].pop(node_id, None)
+            self._setter_state["optimistic_times"].pop(node_id, None)
+        self._schedule_listener_update()
+
     async def _execute_set_request(
         self, node_id: str, value: str, entity_name_for_log: str
     ) -> None:
-        """Execute the API call to set the node value."""
+        """Execute the API call to set the node value.
+
+        While the call runs, identical requests for the node await its outcome
+        through `in_flight_writes` instead of sending the value again.
+        """
+        future = self._start_set_request(node_id, value)
+        success = False
         try:
             success = await self.api_access_manager.submit_request(
                 priority=ApiPriority.HIGH,
@@ -553,8 +1076,7 @@ class HdgDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 value=value,
             )
             if success:
-                self.data[node_id] = value
-                self._setter_state["last_set_times"][node_id] = time.monotonic()
+                self._record_successful_set(node_id, value)
                 _LOGGER.info("Successfully set %s to '%s'.", entity_name_for_log, value)
             else:
                 _LOGGER.error(
@@ -565,12 +1087,64 @@ class HdgDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         except HdgApiError as e:
             _LOGGER.error("API error setting %s: %s", entity_name_for_log, e)
         finally:
-            if self.data.get(node_id) == self._setter_state["optimistic_values"].get(
-                node_id
-            ):
-                self._setter_state["optimistic_values"].pop(node_id, None)
-                self._setter_state["optimistic_times"].pop(node_id, None)
-            self.async_set_updated_data(self.data)
+            self._finish_set_request(node_id, future, success)
+
+    @callback
+    def _schedule_listener_update(self) -> None:
+        """Notify listeners of a set-value outcome on the next loop iteration.
+
+        Outcomes arriving in the same iteration share one listener pass. Unlike
+        `async_set_updated_data`, this leaves the polling schedule untouched.
+        """
+        if self._listener_update_handle is None:
+            self._listener_update_handle = self.hass.loop.call_soon(
+                self._flush_listener_update
+            )
+
+    @callback
+    def _flush_listener_update(self) -> None:
+        """Notify listeners scheduled by `_schedule_listener_update`."""
+        self._listener_update_handle = None
+        self.async_update_listeners()
+
+    async def _await_identical_in_flight_write(
+        self, node_id: str, entity_name_for_log: str, scheduled_generation: int
+    ) -> bool:
+        """Wait for an in-flight write of the same value instead of repeating it.
+
+        Returns:
+            True if that write succeeded and this request is therefore done.
+            False if there is nothing to await, the write failed or a newer
+            request arrived meanwhile; the request then takes the locked path.
+
+        """
+        setter_state = self._setter_state
+        in_flight = setter_state["in_flight_writes"].get(node_id)
+        if (
+            in_flight is None
+            or scheduled_generation != setter_state["current_generations"].get(node_id)
+            or in_flight[0] != setter_state["optimistic_values"].get(node_id)
+        ):
+            return False
+        value, future = in_flight
+        if not await asyncio.shield(future) or scheduled_generation != (
+            setter_state["current_generations"].get(node_id)
+        ):
+            return False
+
+        setter_state["pending_timers"].pop(node_id, None)
+        setter_state["initial_values"].pop(node_id, None)
+        if setter_state["optimistic_values"].get(node_id) == value:
+            setter_state["optimistic_values"].pop(node_id, None)
+            setter_state["optimistic_times"].pop(node_id, None)
+        _USER_ACTION_LOGGER.info(
+            "Skipping set request for %s. Final value '%s' was set by an in-flight "
+            "write.",
+            entity_name_for_log,
+            value,
+        )
+        self._schedule_listener_update()
+        return True
 
     async def _process_debounced_set_value(
         self,
@@ -580,6 +1154,10 @@ class HdgDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         scheduled_generation: int,
     ) -> None:
         """Process the debounced set value and send it to the API."""
+        if await self._await_identical_in_flight_write(
+            node_id, entity_name_for_log, scheduled_generation
+        ):
+            return
         lock = self._setter_state["locks"].setdefault(node_id, asyncio.Lock())
         async with lock:
             should_skip, final_value = self._should_skip_set_request(
@@ -603,22 +1181,19 @@ class HdgDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Gracefully stop the background HdgApiAccessManager task."""
         await self.api_access_manager.stop()
         self._unsubscribe_ping_callback()
+        if self._listener_update_handle is not None:
+            self._listener_update_handle.cancel()
+            self._listener_update_handle = None
 
     def _on_connection_failure(self) -> None:
         """Schedule a recurring ping when we lose connection."""
-        interval = self.entry.options.get(
-            CONF_FALLBACK_PING_INTERVAL, DEFAULT_FALLBACK_PING_INTERVAL
-        )
+        interval = self._fallback_ping_interval
         # If interval is zero, fallback pings are disabled.
         # This is intentional: setting CONF_FALLBACK_PING_INTERVAL to 0 disables pings.
         # nothing to do if user has disabled pings or we’re already scheduled
         if not interval or self._ping_unsub or not self._hostname:
             return
 
-        # clamp once here if you still want min/max enforcement:
-        interval = max(
-            min(interval, MAX_FALLBACK_PING_INTERVAL), MIN_FALLBACK_PING_INTERVAL
-        )
         self._ping_unsub = async_track_time_interval(
             self.hass, self._async_ping_and_refresh, timedelta(seconds=interval)
         )
@@ -647,7 +1222,13 @@ async def async_create_and_refresh_coordinator(
     error_threshold: int,
     hdg_entity_registry: HdgEntityRegistry,
 ) -> HdgDataUpdateCoordinator:
-    """Create, initialize, and perform the first data refresh for the coordinator."""
+    """Create, initialize, and perform the first data refresh for the coordinator.
+
+    Raises:
+        ConfigEntryNotReady: If the first refresh fails or does not finish within
+            `INITIAL_REFRESH_TIMEOUT_S`, so that Home Assistant retries the setup.
+
+    """
     coordinator = HdgDataUpdateCoordinator(
         hass,
         api_client,
@@ -657,5 +1238,29 @@ async def async_create_and_refresh_coordinator(
         error_threshold,
         hdg_entity_registry,
     )
-    await coordinator.async_config_entry_first_refresh()
+    await coordinator.async_restore_polling_state()
+    try:
+        async with asyncio.timeout(INITIAL_REFRESH_TIMEOUT_S):
+            await coordinator.async_config_entry_first_refresh()
+    except TimeoutError as err:
+        raise ConfigEntryNotReady(
+            f"Initial data refresh for {coordinator.name} timed out after "
+            f"{INITIAL_REFRESH_TIMEOUT_S:.0f}s."
+        ) from err
+    except UpdateFailed as err:
+        raise ConfigEntryNotReady(str(err)) from err
     return coordinator
+
+
+def _create_polling_state_store(
+    hass: HomeAssistant, entry_id: str
+) -> Store[PersistedPollingState]:
+    """Create the store holding a config entry's persisted polling state."""
+    return Store(
+        hass, POLLING_STATE_STORAGE_VERSION, f"{POLLING_STATE_STORAGE_KEY}.{entry_id}"
+    )
+
+
+async def async_remove_polling_state(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the persisted polling state of a removed config entry."""
+    await _create_polling_state_store(hass, entry.entry_id).async_remove()
@@ -9,8 +9,10 @@ corresponding Home Assistant entity configurations.
 
 from __future__ import annotations
 
-__version__ = "0.1.15"
+__version__ = "0.1.24"
 
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Final, cast
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
@@ -25,11 +27,19 @@ from homeassistant.const import (
 )
 from homeassistant.helpers.entity import EntityCategory
 
-from .const import (
-    POLLING_GROUP_DEFINITIONS,  # We will derive the keys from here
-)
+from .const import POLLING_GROUP_STATIC_KEYS
+from .helpers.parsers import KNOWN_PARSE_TYPES
 from .models import SensorDefinition  # Import from new models.py
 
+# HDG API data type codes and parser hints shared by the factory functions and
+# the definitions below, so every definition references the same string objects.
+_HDG_DATA_TYPE_NUMERIC: Final = "2"
+_HDG_DATA_TYPE_TEXT: Final = "4"
+_HDG_DATA_TYPE_ENUM: Final = "10"
+_PARSE_FLOAT: Final = "float"
+_PARSE_TEXT: Final = "text"
+_PARSE_ENUM_TEXT: Final = "enum_text"
+
 
 #
 # Entity Definition Factory Functions
@@ -138,9 +148,9 @@ def create_temp_sensor(
         hdg_node_id=node_id,
         translation_key=key,
         polling_group=polling_group,
-        hdg_data_type="2",
+        hdg_data_type=_HDG_DATA_TYPE_NUMERIC,
         hdg_formatter="iTEMP",
-        parse_as_type="float",
+        parse_as_type=_PARSE_FLOAT,
         ha_device_class=SensorDeviceClass.TEMPERATURE,
         ha_native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         ha_state_class=SensorStateClass.MEASUREMENT,
@@ -162,8 +172,8 @@ def create_enum_sensor(
         hdg_node_id=node_id,
         translation_key=key,
         polling_group=polling_group,
-        hdg_data_type="10",
-        parse_as_type="enum_text",
+        hdg_data_type=_HDG_DATA_TYPE_ENUM,
+        parse_as_type=_PARSE_ENUM_TEXT,
         ha_device_class=SensorDeviceClass.ENUM,
         ha_state_class=ha_state_class,
         icon=icon,
@@ -182,8 +192,8 @@ def create_diagnostic_enum_sensor(
         hdg_node_id=node_id,
         translation_key=key,
         polling_group=polling_group,
-        hdg_data_type="10",
-        parse_as_type="enum_text",
+        hdg_data_type=_HDG_DATA_TYPE_ENUM,
+        parse_as_type=_PARSE_ENUM_TEXT,
         ha_device_class=SensorDeviceClass.ENUM,
         ha_native_unit_of_measurement=None,
         ha_state_class=None,
@@ -211,8 +221,8 @@ def create_number_entity(
         hdg_node_id=node_id,
         translation_key=key,
         polling_group=polling_group,
-        hdg_data_type="2",
-        parse_as_type="float",
+        hdg_data_type=_HDG_DATA_TYPE_NUMERIC,
+        parse_as_type=_PARSE_FLOAT,
         ha_platform="number",
         writable=True,
         entity_category=EntityCategory.CONFIG,
@@ -228,6 +238,30 @@ def create_number_entity(
     )
 
 
+def create_temp_number_entity(
+    key: str,
+    node_id: str,
+    polling_group: str,
+    icon: str,
+    setter_min_val: float,
+    setter_max_val: float,
+) -> SensorDefinition:
+    """Create a writable temperature setpoint in whole °C."""
+    return create_number_entity(
+        key=key,
+        node_id=node_id,
+        polling_group=polling_group,
+        icon=icon,
+        setter_type="int",
+        setter_min_val=setter_min_val,
+        setter_max_val=setter_max_val,
+        setter_step=1.0,
+        ha_native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        ha_device_class=SensorDeviceClass.TEMPERATURE,
+        hdg_formatter="iTEMP",
+    )
+
+
 def create_percentage_sensor(
     key: str,
     node_id: str,
@@ -242,8 +276,8 @@ def create_percentage_sensor(
         hdg_node_id=node_id,
         translation_key=key,
         polling_group=polling_group,
-        hdg_data_type="2",
-        parse_as_type="float",
+        hdg_data_type=_HDG_DATA_TYPE_NUMERIC,
+        parse_as_type=_PARSE_FLOAT,
         hdg_formatter="iPERC",
         ha_native_unit_of_measurement=PERCENTAGE,
         ha_state_class=ha_state_class,
@@ -268,8 +302,8 @@ def create_duration_sensor(
         hdg_node_id=node_id,
         translation_key=key,
         polling_group=polling_group,
-        hdg_data_type="2",
-        parse_as_type="float",
+        hdg_data_type=_HDG_DATA_TYPE_NUMERIC,
+        parse_as_type=_PARSE_FLOAT,
         hdg_formatter=hdg_formatter,
         ha_device_class=SensorDeviceClass.DURATION,
         ha_native_unit_of_measurement=unit,
@@ -295,8 +329,8 @@ def create_energy_sensor(
         hdg_node_id=node_id,
         translation_key=key,
         polling_group=polling_group,
-        hdg_data_type="2",
-        parse_as_type="float",
+        hdg_data_type=_HDG_DATA_TYPE_NUMERIC,
+        parse_as_type=_PARSE_FLOAT,
         hdg_formatter=hdg_formatter,
         ha_device_class=ha_device_class,
         ha_native_unit_of_measurement=unit,
@@ -311,7 +345,7 @@ def create_text_sensor(
     node_id: str,
     polling_group: str,
     icon: str,
-    parse_as_type: str = "text",
+    parse_as_type: str = _PARSE_TEXT,
     entity_category: EntityCategory | None = None,
     ha_state_class: SensorStateClass | None = None,
 ) -> SensorDefinition:
@@ -320,7 +354,7 @@ def create_text_sensor(
         hdg_node_id=node_id,
         translation_key=key,
         polling_group=polling_group,
-        hdg_data_type="4",
+        hdg_data_type=_HDG_DATA_TYPE_TEXT,
         parse_as_type=parse_as_type,
         icon=icon,
         entity_category=entity_category,
@@ -333,14 +367,14 @@ def create_diagnostic_text_sensor(
     node_id: str,
     polling_group: str,
     icon: str,
-    parse_as_type: str = "text",
+    parse_as_type: str = _PARSE_TEXT,
 ) -> SensorDefinition:
     """Create a diagnostic sensor for plain text values."""
     return _create_sensor_definition(
         hdg_node_id=node_id,
         translation_key=key,
         polling_group=polling_group,
-        hdg_data_type="4",
+        hdg_data_type=_HDG_DATA_TYPE_TEXT,
         parse_as_type=parse_as_type,
         ha_device_class=None,
         ha_native_unit_of_measurement=None,
@@ -361,8 +395,8 @@ def create_pressure_sensor(
         hdg_node_id=node_id,
         translation_key=key,
         polling_group=polling_group,
-        hdg_data_type="2",
-        parse_as_type="float",
+        hdg_data_type=_HDG_DATA_TYPE_NUMERIC,
+        parse_as_type=_PARSE_FLOAT,
         hdg_formatter="iPASCAL",
         ha_device_class=SensorDeviceClass.PRESSURE,
         ha_native_unit_of_measurement=UnitOfPressure.PA,
@@ -384,8 +418,8 @@ def create_kelvin_sensor(
         hdg_node_id=node_id,
         translation_key=key,
         polling_group=polling_group,
-        hdg_data_type="2",
-        parse_as_type="float",
+        hdg_data_type=_HDG_DATA_TYPE_NUMERIC,
+        parse_as_type=_PARSE_FLOAT,
         hdg_formatter="iKELV",
         ha_native_unit_of_measurement=UnitOfTemperature.KELVIN,
         ha_state_class=SensorStateClass.MEASUREMENT,
@@ -434,8 +468,8 @@ def create_version_sensor(
         hdg_node_id=node_id,
         translation_key=key,
         polling_group=polling_group,
-        hdg_data_type="2",
-        parse_as_type="text",
+        hdg_data_type=_HDG_DATA_TYPE_NUMERIC,
+        parse_as_type=_PARSE_TEXT,
         hdg_formatter="iVERSION",
         ha_device_class=None,
         ha_native_unit_of_measurement=None,
@@ -459,8 +493,8 @@ def create_select_entity(
         hdg_node_id=node_id,
         translation_key=key,
         polling_group=polling_group,
-        hdg_data_type="10",  # Assuming ENUM type for select
-        parse_as_type="enum_text",
+        hdg_data_type=_HDG_DATA_TYPE_ENUM,  # Assuming ENUM type for select
+        parse_as_type=_PARSE_ENUM_TEXT,
         ha_platform="select",
         writable=True,
         entity_category=entity_category,
@@ -472,8 +506,8 @@ def create_select_entity(
 
 
 POLLING_GROUP_KEYS: dict[str, str] = {
-    f"POLLING_GROUP_{i + 1}": group["key"]  # type: ignore[misc]
-    for i, group in enumerate(POLLING_GROUP_DEFINITIONS)
+    f"POLLING_GROUP_{i + 1}": group_key
+    for i, group_key in enumerate(POLLING_GROUP_STATIC_KEYS)
 }
 
 # Master dictionary defining all sensors and entities for the integration.
@@ -487,7 +521,7 @@ POLLING_GROUP_KEYS: dict[str, str] = {
 #   - `writable`: Boolean, true if the node's value can be set.
 #   - `parse_as_type`: Hint for how to parse the raw string value from the API.
 # Each key is a unique identifier (often matching the translation_key) for the entity.
-SENSOR_DEFINITIONS: Final[dict[str, SensorDefinition]] = {
+_SENSOR_DEFINITIONS: Final[dict[str, SensorDefinition]] = {
     "sprache": create_enum_sensor(
         key="sprache",
         node_id="1T",
@@ -561,8 +595,8 @@ SENSOR_DEFINITIONS: Final[dict[str, SensorDefinition]] = {
         key="objektwarmebedarf",
         node_id="17T",
         polling_group=POLLING_GROUP_KEYS["POLLING_GROUP_3"],
-        hdg_data_type="2",
-        parse_as_type="float",
+        hdg_data_type=_HDG_DATA_TYPE_NUMERIC,
+        parse_as_type=_PARSE_FLOAT,
         hdg_formatter="iKW",
         ha_device_class=SensorDeviceClass.POWER,
         ha_native_unit_of_measurement=UnitOfPower.KILO_WATT,
@@ -796,7 +830,7 @@ SENSOR_DEFINITIONS: Final[dict[str, SensorDefinition]] = {
         node_id="4065T",
         polling_group=POLLING_GROUP_KEYS["POLLING_GROUP_4"],
         hdg_data_type="1",
-        parse_as_type="float",
+        parse_as_type=_PARSE_FLOAT,
         hdg_formatter="iLITER",
         ha_device_class=SensorDeviceClass.VOLUME,
         ha_native_unit_of_measurement=UnitOfVolume.LITERS,
@@ -845,33 +879,21 @@ SENSOR_DEFINITIONS: Final[dict[str, SensorDefinition]] = {
         polling_group=POLLING_GROUP_KEYS["POLLING_GROUP_4"],
         icon="mdi:label-outline",
     ),
-    "hk1_soll_normal": create_number_entity(
+    "hk1_soll_normal": create_temp_number_entity(
         key="hk1_soll_normal",
         node_id="6022T",
         polling_group=POLLING_GROUP_KEYS["POLLING_GROUP_1"],
         icon="mdi:home-thermometer",
-        setter_type="int",
         setter_min_val=0.0,
         setter_max_val=90.0,
-        setter_step=1.0,
-        ha_device_class=SensorDeviceClass.TEMPERATURE,
-        ha_native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        hdg_formatter="iTEMP",
-        ha_state_class=SensorStateClass.MEASUREMENT,
     ),
-    "hk1_soll_absenk": create_number_entity(
+    "hk1_soll_absenk": create_temp_number_entity(
         key="hk1_soll_absenk",
         node_id="6023T",
         polling_group=POLLING_GROUP_KEYS["POLLING_GROUP_1"],
         icon="mdi:home-thermometer-outline",
-        setter_type="int",
         setter_min_val=0.0,
         setter_max_val=90.0,
-        setter_step=1.0,
-        ha_device_class=SensorDeviceClass.TEMPERATURE,
-        ha_native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        hdg_formatter="iTEMP",
-        ha_state_class=SensorStateClass.MEASUREMENT,
     ),
     "hk1_parallelverschiebung": create_number_entity(
         key="hk1_parallelverschiebung",
@@ -890,8 +912,8 @@ SENSOR_DEFINITIONS: Final[dict[str, SensorDefinition]] = {
         key="hk1_raumeinflussfaktor",
         node_id="6025T",
         polling_group=POLLING_GROUP_KEYS["POLLING_GROUP_2"],
-        hdg_data_type="2",
-        parse_as_type="float",
+        hdg_data_type=_HDG_DATA_TYPE_NUMERIC,
+        parse_as_type=_PARSE_FLOAT,
         ha_state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:home-import-outline",
     ),
@@ -952,19 +974,13 @@ SENSOR_DEFINITIONS: Final[dict[str, SensorDefinition]] = {
         polling_group=POLLING_GROUP_KEYS["POLLING_GROUP_4"],
         icon="mdi:pump-outline",
     ),
-    "hk1_pumpe_aus_aussentemperatur": create_number_entity(
+    "hk1_pumpe_aus_aussentemperatur": create_temp_number_entity(
         key="hk1_pumpe_aus_aussentemperatur",
         node_id="6047T",
         polling_group=POLLING_GROUP_KEYS["POLLING_GROUP_4"],
         icon="mdi:pump-off-outline",
-        setter_type="int",
         setter_min_val=0.0,
         setter_max_val=50.0,
-        setter_step=1.0,
-        ha_device_class=SensorDeviceClass.TEMPERATURE,
-        ha_native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        hdg_formatter="iTEMP",
-        ha_state_class=SensorStateClass.MEASUREMENT,
     ),
     "hk1_frostschutz_temp": create_temp_sensor(
         key="hk1_frostschutz_temp",
@@ -972,19 +988,13 @@ SENSOR_DEFINITIONS: Final[dict[str, SensorDefinition]] = {
         polling_group=POLLING_GROUP_KEYS["POLLING_GROUP_4"],
         icon="mdi:snowflake-thermometer",
     ),
-    "hk1_eco_absenken_aus_aussentemperatur": create_number_entity(
+    "hk1_eco_absenken_aus_aussentemperatur": create_temp_number_entity(
         key="hk1_eco_absenken_aus_aussentemperatur",
         node_id="6049T",
         polling_group=POLLING_GROUP_KEYS["POLLING_GROUP_4"],
         icon="mdi:leaf-thermometer",
-        setter_type="int",
         setter_min_val=0.0,
         setter_max_val=50.0,
-        setter_step=1.0,
-        ha_device_class=SensorDeviceClass.TEMPERATURE,
-        ha_native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        hdg_formatter="iTEMP",
-        ha_state_class=SensorStateClass.MEASUREMENT,
     ),
     "hk1_heizgrenze_sommer": create_temp_sensor(
         key="hk1_heizgrenze_sommer",
@@ -1170,8 +1180,8 @@ SENSOR_DEFINITIONS: Final[dict[str, SensorDefinition]] = {
         key="anzahl_rostkippungen",
         node_id="22016T",
         polling_group=POLLING_GROUP_KEYS["POLLING_GROUP_5"],
-        hdg_data_type="2",
-        parse_as_type="float",
+        hdg_data_type=_HDG_DATA_TYPE_NUMERIC,
+        parse_as_type=_PARSE_FLOAT,
         ha_state_class=SensorStateClass.TOTAL_INCREASING,
         icon="mdi:recycle-variant",
         entity_category=EntityCategory.DIAGNOSTIC,
@@ -1352,7 +1362,7 @@ SENSOR_DEFINITIONS: Final[dict[str, SensorDefinition]] = {
         key="kessel_nachlegezeitpunkt_2",
         node_id="22053T",
         polling_group=POLLING_GROUP_KEYS["POLLING_GROUP_5"],
-        hdg_data_type="2",
+        hdg_data_type=_HDG_DATA_TYPE_NUMERIC,
         parse_as_type="hdg_datetime_or_text",
         hdg_formatter="iRSINLM",
         ha_device_class=SensorDeviceClass.TIMESTAMP,
@@ -1570,8 +1580,8 @@ SENSOR_DEFINITIONS: Final[dict[str, SensorDefinition]] = {
         key="hk1_temp_quelle_status_wert",
         node_id="26004T",
         polling_group=POLLING_GROUP_KEYS["POLLING_GROUP_5"],
-        hdg_data_type="2",
-        parse_as_type="float",
+        hdg_data_type=_HDG_DATA_TYPE_NUMERIC,
+        parse_as_type=_PARSE_FLOAT,
         ha_state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:thermometer-lines",
     ),
@@ -1627,33 +1637,21 @@ SENSOR_DEFINITIONS: Final[dict[str, SensorDefinition]] = {
         polling_group=POLLING_GROUP_KEYS["POLLING_GROUP_4"],
         icon="mdi:label-outline",
     ),
-    "hk2_soll_normal": create_number_entity(
+    "hk2_soll_normal": create_temp_number_entity(
         key="hk2_soll_normal",
         node_id="6122T",
         polling_group=POLLING_GROUP_KEYS["POLLING_GROUP_1"],
         icon="mdi:home-thermometer",
-        setter_type="int",
         setter_min_val=0.0,
         setter_max_val=90.0,
-        setter_step=1.0,
-        ha_device_class=SensorDeviceClass.TEMPERATURE,
-        ha_native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        hdg_formatter="iTEMP",
-        ha_state_class=SensorStateClass.MEASUREMENT,
     ),
-    "hk2_soll_absenk": create_number_entity(
+    "hk2_soll_absenk": create_temp_number_entity(
         key="hk2_soll_absenk",
         node_id="6123T",
         polling_group=POLLING_GROUP_KEYS["POLLING_GROUP_1"],
         icon="mdi:home-thermometer-outline",
-        setter_type="int",
         setter_min_val=0.0,
         setter_max_val=90.0,
-        setter_step=1.0,
-        ha_device_class=SensorDeviceClass.TEMPERATURE,
-        ha_native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        hdg_formatter="iTEMP",
-        ha_state_class=SensorStateClass.MEASUREMENT,
     ),
     "hk2_parallelverschiebung": create_number_entity(
         key="hk2_parallelverschiebung",
@@ -1672,8 +1670,8 @@ SENSOR_DEFINITIONS: Final[dict[str, SensorDefinition]] = {
         key="hk2_raumeinflussfaktor",
         node_id="6125T",
         polling_group=POLLING_GROUP_KEYS["POLLING_GROUP_2"],
-        hdg_data_type="2",
-        parse_as_type="float",
+        hdg_data_type=_HDG_DATA_TYPE_NUMERIC,
+        parse_as_type=_PARSE_FLOAT,
         ha_state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:home-import-outline",
     ),
@@ -1734,19 +1732,13 @@ SENSOR_DEFINITIONS: Final[dict[str, SensorDefinition]] = {
         polling_group=POLLING_GROUP_KEYS["POLLING_GROUP_4"],
         icon="mdi:pump-outline",
     ),
-    "hk2_pumpe_aus_aussentemperatur": create_number_entity(
+    "hk2_pumpe_aus_aussentemperatur": create_temp_number_entity(
         key="hk2_pumpe_aus_aussentemperatur",
         node_id="6147T",
         polling_group=POLLING_GROUP_KEYS["POLLING_GROUP_4"],
         icon="mdi:pump-off-outline",
-        setter_type="int",
         setter_min_val=0.0,
         setter_max_val=50.0,
-        setter_step=1.0,
-        ha_device_class=SensorDeviceClass.TEMPERATURE,
-        ha_native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        hdg_formatter="iTEMP",
-        ha_state_class=SensorStateClass.MEASUREMENT,
     ),
     "hk2_frostschutz_temp": create_temp_sensor(
         key="hk2_frostschutz_temp",
@@ -1754,19 +1746,13 @@ SENSOR_DEFINITIONS: Final[dict[str, SensorDefinition]] = {
         polling_group=POLLING_GROUP_KEYS["POLLING_GROUP_4"],
         icon="mdi:snowflake-thermometer",
     ),
-    "hk2_eco_absenken_aus_aussentemperatur": create_number_entity(
+    "hk2_eco_absenken_aus_aussentemperatur": create_temp_number_entity(
         key="hk2_eco_absenken_aus_aussentemperatur",
         node_id="6149T",
         polling_group=POLLING_GROUP_KEYS["POLLING_GROUP_4"],
         icon="mdi:leaf-thermometer",
-        setter_type="int",
         setter_min_val=0.0,
         setter_max_val=50.0,
-        setter_step=1.0,
-        ha_device_class=SensorDeviceClass.TEMPERATURE,
-        ha_native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        hdg_formatter="iTEMP",
-        ha_state_class=SensorStateClass.MEASUREMENT,
     ),
     "hk2_heizgrenze_sommer": create_temp_sensor(
         key="hk2_heizgrenze_sommer",
@@ -1796,8 +1782,8 @@ SENSOR_DEFINITIONS: Final[dict[str, SensorDefinition]] = {
         key="hk2_temp_quelle_status_wert",
         node_id="26104T",
         polling_group=POLLING_GROUP_KEYS["POLLING_GROUP_5"],
-        hdg_data_type="2",
-        parse_as_type="float",
+        hdg_data_type=_HDG_DATA_TYPE_NUMERIC,
+        parse_as_type=_PARSE_FLOAT,
         ha_state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:thermometer-lines",
     ),
@@ -1854,33 +1840,21 @@ SENSOR_DEFINITIONS: Final[dict[str, SensorDefinition]] = {
         icon="mdi:pump",
         entity_category=EntityCategory.DIAGNOSTIC,
     ),    
-    "ww1_erhitzen_an_schwelle": create_number_entity(
+    "ww1_erhitzen_an_schwelle": create_temp_number_entity(
         key="ww1_erhitzen_an_schwelle",
         node_id="8021T",
         polling_group=POLLING_GROUP_KEYS["POLLING_GROUP_1"],
         icon="mdi:thermometer-chevron-up",
-        setter_type="int",
         setter_min_val=10.0,
         setter_max_val=60.0,
-        setter_step=1.0,
-        ha_device_class=SensorDeviceClass.TEMPERATURE,
-        ha_native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        hdg_formatter="iTEMP",
-        ha_state_class=SensorStateClass.MEASUREMENT,
     ),
-    "ww1_erhitzen_aus_schwelle": create_number_entity(
+    "ww1_erhitzen_aus_schwelle": create_temp_number_entity(
         key="ww1_erhitzen_aus_schwelle",
         node_id="8022T",
         polling_group=POLLING_GROUP_KEYS["POLLING_GROUP_1"],
         icon="mdi:thermometer-chevron-down",
-        setter_type="int",
         setter_min_val=20.0,
         setter_max_val=70.0,
-        setter_step=1.0,
-        ha_device_class=SensorDeviceClass.TEMPERATURE,
-        ha_native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        hdg_formatter="iTEMP",
-        ha_state_class=SensorStateClass.MEASUREMENT,
     ),
     "ww1_temperatur_vorlauf_solar_ist": create_temp_sensor(
         key="ww1_temperatur_vorlauf_solar_ist",
@@ -1896,3 +1870,50 @@ SENSOR_DEFINITIONS: Final[dict[str, SensorDefinition]] = {
         entity_category=EntityCategory.DIAGNOSTIC,
     )
 }
+
+# Read-only view handed out to the registry; the table is static, so consumers
+# can share it without copying.
+SENSOR_DEFINITIONS: Final[Mapping[str, SensorDefinition]] = MappingProxyType(
+    _SENSOR_DEFINITIONS
+)
+
+# Schema check for the table above, run once at import. Definitions are static,
+# so the registry and the platforms can rely on these keys without re-validating
+# each entry during setup.
+_ALLOWED_DEFINITION_KEYS: Final[frozenset[str]] = (
+    SensorDefinition.__required_keys__ | SensorDefinition.__optional_keys__
+)
+_REQUIRED_DEFINITION_KEYS: Final[frozenset[str]] = frozenset(
+    ("hdg_node_id", "translation_key", "polling_group", "ha_platform", "parse_as_type")
+)
+# Node IDs intentionally exposed by more than one entity. "19T" reports the
+# reload step both as text and as a percentage.
+_SHARED_NODE_IDS: Final[frozenset[str]] = frozenset(("19T",))
+
+
+def _validate_sensor_definitions() -> None:
+    """Raise ValueError if an entry of `SENSOR_DEFINITIONS` breaks the schema."""
+    seen_node_ids: set[str] = set()
+    for key, definition in SENSOR_DEFINITIONS.items():
+        if not (
+            _REQUIRED_DEFINITION_KEYS <= definition.keys() <= _ALLOWED_DEFINITION_KEYS
+        ):
+            raise ValueError(
+                f"SENSOR_DEFINITIONS entry '{key}' has missing or unknown keys."
+            )
+        if (
+            key != definition["translation_key"]
+            or definition["parse_as_type"] not in KNOWN_PARSE_TYPES
+            or definition["polling_group"] not in POLLING_GROUP_STATIC_KEYS
+        ):
+            raise ValueError(
+                f"SENSOR_DEFINITIONS entry '{key}' has an invalid key, parser or group."
+            )
+        node_id = definition["hdg_node_id"]
+        if node_id in seen_node_ids:
+            raise ValueError(f"SENSOR_DEFINITIONS defines node ID '{node_id}' twice.")
+        if node_id not in _SHARED_NODE_IDS:
+            seen_node_ids.add(node_id)
+
+
+_validate_sensor_definitions()
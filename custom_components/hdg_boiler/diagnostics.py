@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-__version__ = "0.2.0"
+__version__ = "0.2.5"
 __all__ = ["async_get_config_entry_diagnostics"]
 
 import ipaddress
 import logging
+import time
 from typing import Any, cast
 from urllib.parse import ParseResult, urlparse, urlunparse
 
@@ -79,6 +80,9 @@ def _get_coordinator_diagnostics(
     if not coordinator:
         return "Coordinator not found or not initialized."
 
+    polling_state = coordinator.polling_state
+    # Poll and retry times are monotonic; shift them onto the wall clock.
+    wall_offset = time.time() - time.monotonic()
     coordinator_diag: dict[str, Any] = {
         "last_update_success": coordinator.last_update_success,
         "last_update_time_successful": (
@@ -86,29 +90,32 @@ def _get_coordinator_diagnostics(
             if coordinator.last_update_success_time
             else None
         ),
-        "scan_intervals_used": {
-            k: v.total_seconds() for k, v in coordinator.scan_intervals.items()
-        },
+        "scan_intervals_used": dict(coordinator.scan_intervals),
         "last_update_times_per_group": {
-            k: dt_util.utc_from_timestamp(v).isoformat()
-            for k, v in coordinator.last_update_times_public.items()
+            k: _monotonic_to_isoformat(v, wall_offset)
+            for k, v in polling_state["last_update_times"].items()
         },
-        "consecutive_poll_failures": coordinator._consecutive_poll_failures,
-        "boiler_considered_online": coordinator._boiler_considered_online,
+        "consecutive_poll_failures": polling_state["consecutive_failures"],
+        "boiler_considered_online": coordinator.boiler_is_online,
         "failed_poll_group_retry_info": {
             k: {
-                "attempts": v["attempts"],
-                "next_retry_time_utc": dt_util.utc_from_timestamp(
-                    v["next_retry_time"]
-                ).isoformat(),
+                "attempts": v.attempts,
+                "next_retry_time": _monotonic_to_isoformat(
+                    v.next_retry_time, wall_offset
+                ),
             }
-            for k, v in coordinator._failed_poll_group_retry_info.items()
-            if v["next_retry_time"] > 0
+            for k, v in polling_state["failed_group_retry_info"].items()
+            if v.next_retry_time > 0
         },
     }
-    if coordinator.data:
+    # Nodes not polled yet hold a None placeholder and are left out.
+    if polled_data := {
+        node_id: value
+        for node_id, value in (coordinator.data or {}).items()
+        if value is not None
+    }:
         redacted_data = async_redact_data(
-            coordinator.data, DIAGNOSTICS_SENSITIVE_COORDINATOR_DATA_NODE_IDS
+            polled_data, DIAGNOSTICS_SENSITIVE_COORDINATOR_DATA_NODE_IDS
         )
         coordinator_diag["data_item_count"] = len(redacted_data)
         coordinator_diag["data_sample_keys"] = list(redacted_data.keys())[:20]
@@ -116,6 +123,14 @@ def _get_coordinator_diagnostics(
     return coordinator_diag
 
 
+def _monotonic_to_isoformat(timestamp: float, wall_offset: float) -> str | None:
+    """Convert a monotonic timestamp to ISO format, or None if it was never set."""
+    if timestamp <= 0:
+        return None
+    isoformat: str = dt_util.utc_from_timestamp(timestamp + wall_offset).isoformat()
+    return isoformat
+
+
 def _get_api_client_diagnostics(
     api_client: Any, sensitive_host_ip: str | None
 ) -> dict[str, Any]:
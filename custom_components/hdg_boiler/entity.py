@@ -9,7 +9,7 @@ availability and attributes.
 
 from __future__ import annotations
 
-__version__ = "0.2.2"
+__version__ = "0.2.6"
 __all__ = ["HdgBaseEntity", "HdgNodeEntity"]
 
 import logging
@@ -29,6 +29,7 @@ from .const import (
     HDG_DATETIME_SPECIAL_TEXT,
     HDG_UNAVAILABLE_STRINGS,
     LIFECYCLE_LOGGER_NAME,
+    MANUFACTURER,
 )
 from .coordinator import HdgDataUpdateCoordinator
 from .helpers.logging_utils import format_for_log
@@ -102,7 +103,7 @@ class HdgBaseEntity(CoordinatorEntity[HdgDataUpdateCoordinator]):
         return DeviceInfo(
             identifiers={(DOMAIN, device_identifier)},
             name=device_name,
-            manufacturer="HDG Bavaria GmbH",
+            manufacturer=MANUFACTURER,
             model="Boiler Control",
             configuration_url=config_url,
         )
@@ -185,15 +186,21 @@ class HdgNodeEntity(HdgBaseEntity):
             and HDG_DATETIME_SPECIAL_TEXT in text_lower
         )
 
+    @property
+    def _entity_id_for_log(self) -> str | None:
+        """Return the entity ID, or the unique ID before the entity is added."""
+        entity_id_for_log: str | None = self.entity_id if self.hass else self.unique_id
+        return entity_id_for_log
+
     @property
     def available(self) -> bool:
         """Determine if the entity is available."""
-        entity_id_for_log = self.entity_id if self.hass else self.unique_id
-
+        # Runs on every state write; the log name is only resolved on the
+        # unavailable paths below, not when the entity is available.
         if not super().available:
             _ENTITY_DETAIL_LOGGER.debug(
                 "%s (Node %s): unavailable via HdgBaseEntity",
-                entity_id_for_log,
+                self._entity_id_for_log,
                 self._node_id,
             )
             return False
@@ -202,7 +209,7 @@ class HdgNodeEntity(HdgBaseEntity):
         if raw_value is None:
             _ENTITY_DETAIL_LOGGER.debug(
                 "%s (Node %s): unavailable, raw_value is None",
-                entity_id_for_log,
+                self._entity_id_for_log,
                 self._node_id,
             )
             return False
@@ -210,7 +217,7 @@ class HdgNodeEntity(HdgBaseEntity):
         if self._is_value_unavailable(raw_value):
             _ENTITY_DETAIL_LOGGER.debug(
                 "%s (Node %s): unavailable, value '%s' is a known unavailable string.",
-                entity_id_for_log,
+                self._entity_id_for_log,
                 self._node_id,
                 raw_value,
             )
@@ -236,6 +243,8 @@ class HdgNodeEntity(HdgBaseEntity):
 
     def _log_entity_details(self, prefix: str, details: dict[str, Any]) -> None:
         """Log detailed entity information using _ENTITY_DETAIL_LOGGER."""
+        if not _ENTITY_DETAIL_LOGGER.isEnabledFor(logging.DEBUG):
+            return
         _ENTITY_DETAIL_LOGGER.debug(
             "%s: Entity Details: %s", prefix, format_for_log(details)
         )
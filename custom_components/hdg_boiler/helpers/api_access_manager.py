@@ -9,13 +9,11 @@ critical operations.
 
 from __future__ import annotations
 
-from __future__ import annotations
-
-__version__ = "0.9.0"
-__all__ = ["HdgApiAccessManager", "ApiPriority"]
+__version__ = "0.11.1"
+__all__ = ["HdgApiAccessManager", "ApiPriority", "RequestSpec"]
 
 import asyncio
-import logging
+import time
 from asyncio import Future, Task
 from collections.abc import Awaitable, Callable
 from contextlib import suppress
@@ -28,15 +26,13 @@ from homeassistant.core import HomeAssistant
 
 from ..api import HdgApiClient
 from ..const import (
-    API_LOGGER_NAME,
     API_REQUEST_TYPE_SET_NODE_VALUE,
-    LIFECYCLE_LOGGER_NAME,
+    LOW_PRIORITY_REQUEST_BURST,
+    LOW_PRIORITY_REQUEST_RATE_PER_S,
     SET_VALUE_RETRY_ATTEMPTS,
     SET_VALUE_RETRY_DELAY_S,
 )
-
-_LIFECYCLE_LOGGER = logging.getLogger(LIFECYCLE_LOGGER_NAME)
-_API_LOGGER = logging.getLogger(API_LOGGER_NAME)
+from .logging_utils import _API_LOGGER, _LIFECYCLE_LOGGER
 
 
 class ApiPriority(Enum):
@@ -69,6 +65,46 @@ class ApiRequest:
     retry_count: int = 0
 
 
+@dataclass(slots=True)
+class _TokenBucket:
+    """Token bucket limiting how fast requests may be sent."""
+
+    rate: float
+    capacity: float
+    tokens: float = field(init=False)
+    updated: float = field(init=False, default_factory=time.monotonic)
+
+    def __post_init__(self) -> None:
+        """Start with a full bucket."""
+        self.tokens = self.capacity
+
+    def try_acquire(self) -> float:
+        """Take a token if available.
+
+        Returns:
+            0.0 if a token was taken, otherwise the seconds until one is available.
+
+        """
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return 0.0
+        return (1.0 - self.tokens) / self.rate
+
+
+@dataclass(slots=True, frozen=True)
+class RequestSpec:
+    """Describes one request of a batch passed to `submit_batch`."""
+
+    priority: ApiPriority
+    coroutine: Callable[..., Awaitable[Any]]
+    request_type: str
+    context_key: str | None = None
+    kwargs: dict[str, Any] = field(default_factory=dict)
+
+
 class HdgApiAccessManager:
     """Manages and prioritizes API access to the HDG Boiler."""
 
@@ -89,6 +125,14 @@ class HdgApiAccessManager:
         self._submit_lock = asyncio.Lock()
         self._pending_requests: dict[str, ApiRequest] = {}
         self._worker_task: Task[None] | None = None
+        # Regular polling goes through this bucket so that a cycle with many
+        # due batches does not hit the boiler with them back to back; higher
+        # priorities, user writes in particular, are never held back.
+        self._low_priority_bucket = _TokenBucket(
+            LOW_PRIORITY_REQUEST_RATE_PER_S, LOW_PRIORITY_REQUEST_BURST
+        )
+        # Set whenever a request is queued; ends a rate-limit wait early.
+        self._request_queued = asyncio.Event()
         _LIFECYCLE_LOGGER.debug("HdgApiAccessManager initialized.")
 
     def start(self, entry: ConfigEntry) -> None:
@@ -176,35 +220,29 @@ class HdgApiAccessManager:
             )
 
         await self._request_queue.put((priority, self._request_id_counter, request))
+        self._request_queued.set()
 
-    async def submit_request(
+    async def _enqueue_request(
         self,
         priority: ApiPriority,
         coroutine: Callable[..., Awaitable[Any]],
         request_type: str,
-        context_key: str | None = None,
+        context_key: str | None,
         *args: Any,
         **kwargs: Any,
-    ) -> Any:
-        """Submit an API request for prioritized processing."""
-        async with self._submit_lock:
-            if context_key and (
-                existing_request := self._pending_requests.get(context_key)
-            ):
-                future = self._handle_existing_request(existing_request, request_type)
-                # If the future is different, a new request must be queued.
-                if future is not existing_request.future:
-                    await self._create_and_queue_request(
-                        priority,
-                        coroutine,
-                        request_type,
-                        context_key,
-                        future,
-                        *args,
-                        **kwargs,
-                    )
-            else:
-                future = self.hass.loop.create_future()
+    ) -> Future[Any]:
+        """Queue a request, or join a pending one, and return its future.
+
+        Must be called with `_submit_lock` held.
+        """
+        if context_key and (
+            existing_request := self._pending_requests.get(context_key)
+        ):
+            future: Future[Any] = self._handle_existing_request(
+                existing_request, request_type
+            )
+            # If the future is different, a new request must be queued.
+            if future is not existing_request.future:
                 await self._create_and_queue_request(
                     priority,
                     coroutine,
@@ -214,8 +252,49 @@ class HdgApiAccessManager:
                     *args,
                     **kwargs,
                 )
+            return future
+        future = self.hass.loop.create_future()
+        await self._create_and_queue_request(
+            priority, coroutine, request_type, context_key, future, *args, **kwargs
+        )
+        return future
+
+    async def submit_request(
+        self,
+        priority: ApiPriority,
+        coroutine: Callable[..., Awaitable[Any]],
+        request_type: str,
+        context_key: str | None = None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        """Submit an API request for prioritized processing."""
+        async with self._submit_lock:
+            future = await self._enqueue_request(
+                priority, coroutine, request_type, context_key, *args, **kwargs
+            )
         return await future
 
+    async def submit_batch(self, specs: list[RequestSpec]) -> list[Future[Any]]:
+        """Queue several API requests at once and return their futures.
+
+        All requests are queued under a single acquisition of the submit lock,
+        so the worker sees the whole batch before it picks the next request.
+        The futures are returned in the order of `specs`; awaiting them is up
+        to the caller.
+        """
+        async with self._submit_lock:
+            return [
+                await self._enqueue_request(
+                    spec.priority,
+                    spec.coroutine,
+                    spec.request_type,
+                    spec.context_key,
+                    **spec.kwargs,
+                )
+                for spec in specs
+            ]
+
     def _cleanup_pending_request(self, key: str, req_id: int) -> None:
         """Remove a request from the pending dict once its future is done."""
         pending_req = self._pending_requests.get(key)
@@ -240,6 +319,7 @@ class HdgApiAccessManager:
             await self._request_queue.put(
                 (request.priority, self._request_id_counter, request)
             )
+            self._request_queued.set()
 
     async def _handle_request_failure(
         self, request: ApiRequest, exception: Exception
@@ -266,7 +346,7 @@ class HdgApiAccessManager:
         """Background task that processes API requests from the queue."""
         while True:
             try:
-                _, _, request = await self._request_queue.get()
+                priority, sequence, request = await self._request_queue.get()
 
                 if request.is_superseded:
                     _API_LOGGER.debug(
@@ -275,6 +355,29 @@ class HdgApiAccessManager:
                     )
                     self._request_queue.task_done()
                     continue
+                # The caller gave up while the request was queued, e.g. a poll
+                # cycle cancelled its other batches after a connection error;
+                # nobody would receive the result.
+                if request.future.cancelled():
+                    _API_LOGGER.debug(
+                        "Skipping cancelled request for context '%s'",
+                        request.context_key,
+                    )
+                    self._request_queue.task_done()
+                    continue
+                if priority is ApiPriority.LOW and (
+                    wait := self._low_priority_bucket.try_acquire()
+                ):
+                    # Requeue before waiting, so that a shutdown drains this
+                    # request with the rest of the queue, and stop waiting as
+                    # soon as another request arrives: it may outrank this one.
+                    self._request_queue.put_nowait((priority, sequence, request))
+                    self._request_queue.task_done()
+                    self._request_queued.clear()
+                    with suppress(TimeoutError):
+                        async with asyncio.timeout(wait):
+                            await self._request_queued.wait()
+                    continue
 
                 await self._process_request(request)
 
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-__version__ = "0.6.0"
+__version__ = "0.6.2"
 
 import logging
+from functools import cache
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
@@ -19,6 +20,7 @@ from ..const import (
     ENTITY_DETAIL_LOGGER_NAME,
     HEURISTICS_LOGGER_NAME,
     LIFECYCLE_LOGGER_NAME,
+    LOG_LEVELS,
     PROCESSOR_LOGGER_NAME,
     USER_ACTION_LOGGER_NAME,
 )
@@ -89,8 +91,13 @@ def format_for_log(obj: Any, max_len: int = 150) -> str:
     return f"{s[: max_len - 3]}..." if len(s) > max_len else s
 
 
+@cache
 def make_log_prefix(node_id: str | None, entity_name: str | None) -> str:
-    """Create a consistent log prefix for a given node ID and entity name."""
+    """Create a consistent log prefix for a given node ID and entity name.
+
+    Every parsed value builds a prefix whether or not anything is logged; the
+    (node, entity) pairs are a fixed set, so each prefix is built only once.
+    """
     parts = [f"[{part}]" for part in (entity_name, node_id) if part]
     return "".join(parts) + " " if parts else ""
 
@@ -98,7 +105,7 @@ def make_log_prefix(node_id: str | None, entity_name: str | None) -> str:
 def configure_loggers(entry: ConfigEntry) -> None:
     """Set up the integration's loggers based on user configuration."""
     log_level_str = entry.options.get(CONF_LOG_LEVEL, DEFAULT_LOG_LEVEL).upper()
-    log_level = getattr(logging, log_level_str, logging.INFO)
+    log_level = LOG_LEVELS.get(log_level_str, logging.INFO)
     is_advanced = bool(
         entry.options.get(CONF_ADVANCED_LOGGING, DEFAULT_ADVANCED_LOGGING)
     )
@@ -7,14 +7,15 @@ locale-specific number formats, unit stripping, and various data types.
 
 from __future__ import annotations
 
-__version__ = "0.5.0"
+__version__ = "0.5.7"
 
 import html
 import logging
 import re
 from collections.abc import Callable
 from datetime import datetime
-from typing import Any, Final
+from functools import cache
+from typing import Any, Final, cast
 
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
@@ -30,7 +31,11 @@ from .logging_utils import make_log_prefix
 _LOGGER = logging.getLogger(DOMAIN)
 _HEURISTICS_LOGGER = logging.getLogger(HEURISTICS_LOGGER_NAME)
 
-__all__ = ["parse_sensor_value", "format_value_for_api"]
+__all__ = ["KNOWN_PARSE_TYPES", "parse_sensor_value", "format_value_for_api"]
+
+# Regex for a plain decimal value ("23,4", "-5", "1234.5"), the common case for
+# numeric nodes. Such values skip unit stripping and numeric extraction.
+_PLAIN_NUMBER_REGEX: Final = re.compile(r"[-+]?\d+(?:[.,]\d+)?")
 
 # Regex to find the first numeric part of a string.
 _NUMERIC_PART_REGEX: Final = re.compile(r"([-+]?\d*[.,]?\d+)")
@@ -92,6 +97,9 @@ def _parse_number(
     raw_value: str, target_type: type[int] | type[float], log_prefix: str
 ) -> int | float | None:
     """Parse a number from a string into the specified type."""
+    if _PLAIN_NUMBER_REGEX.fullmatch(raw_value):
+        return target_type(float(raw_value.replace(",", ".")))
+
     numeric_str = _extract_numeric_string(raw_value, log_prefix)
     if numeric_str is None:
         return None
@@ -108,17 +116,24 @@ def _parse_number(
         return None
 
 
-def _get_source_timezone(timezone_str: str, log_prefix: str) -> ZoneInfo | None:
-    """Get a ZoneInfo object from a string, with error logging."""
+@cache
+def _load_timezone(timezone_str: str) -> ZoneInfo | None:
+    """Resolve a timezone name once; None if it is unknown."""
     try:
         return ZoneInfo(timezone_str)
     except ZoneInfoNotFoundError:
+        return None
+
+
+def _get_source_timezone(timezone_str: str, log_prefix: str) -> ZoneInfo | None:
+    """Get a ZoneInfo object from a string, with error logging."""
+    if (source_tz := _load_timezone(timezone_str)) is None:
         _LOGGER.error(
             "%sInvalid source timezone '%s'. Cannot parse datetime.",
             log_prefix,
             timezone_str,
         )
-        return None
+    return source_tz
 
 
 def _parse_datetime(
@@ -165,7 +180,7 @@ def _convert_enum_text_to_key(
     if not enum_map:
         return value
 
-    if key := next((k for text, k in enum_map.items() if text == value), None):
+    if key := enum_map.get(value):
         _LOGGER.debug("%sMapped enum '%s' to key '%s'.", log_prefix, value, key)
         return key
 
@@ -194,7 +209,7 @@ def _prepare_parser_and_value(
     raw_value: str | None,
     entity_definition: dict[str, Any],
     log_prefix: str,
-) -> tuple[Callable[..., Any] | None, str | None]:
+) -> tuple[_ValueParser | None, str | None]:
     """Prepare the parser and cleaned value, returning None if parsing is not possible."""
     if raw_value is None:
         return None, None
@@ -202,7 +217,7 @@ def _prepare_parser_and_value(
     cleaned_value = html.unescape(str(raw_value)).strip()
     parse_as_type = entity_definition.get("parse_as_type")
 
-    if not parse_as_type or parse_as_type not in _PARSER_MAP:
+    if (parser := _PARSER_MAP.get(parse_as_type or "")) is None:
         _LOGGER.warning(
             "%sUnknown or invalid parse_as_type '%s'. Returning raw value.",
             log_prefix,
@@ -210,27 +225,60 @@ def _prepare_parser_and_value(
         )
         return None, cleaned_value
 
-    return _PARSER_MAP.get(parse_as_type), cleaned_value
+    return parser, cleaned_value
 
 
 # --- Main Parser ---
 
-_PARSER_MAP: Final[dict[str, Callable[..., Any]]] = {
-    "int": lambda value, prefix, *args, **kwargs: _parse_number(value, int, prefix),
-    "float": lambda value, prefix, *args, **kwargs: _parse_number(value, float, prefix),
-    "enum_text": lambda value,
-    prefix,
-    entity_def,
-    *args,
-    **kwargs: _convert_enum_text_to_key(value, entity_def, prefix),
-    "hdg_datetime_or_text": lambda value,
-    prefix,
-    *args,
-    timezone,
-    **kwargs: _parse_datetime(value, timezone, prefix),
-    "text": lambda value, *args, **kwargs: value,
-    "allow_empty_string": lambda value, *args, **kwargs: value,
+# Every parser takes (value, log_prefix, entity_definition, timezone) positionally,
+# so dispatch is a single dict lookup and call without packing *args/**kwargs.
+type _ValueParser = Callable[[str, str, dict[str, Any], str], Any]
+
+
+def _parse_int(
+    value: str, log_prefix: str, _entity_def: dict[str, Any], _timezone: str
+) -> int | None:
+    """Parse a value as an integer."""
+    return cast(int | None, _parse_number(value, int, log_prefix))
+
+
+def _parse_float(
+    value: str, log_prefix: str, _entity_def: dict[str, Any], _timezone: str
+) -> float | None:
+    """Parse a value as a float."""
+    return _parse_number(value, float, log_prefix)
+
+
+def _parse_enum_text(
+    value: str, log_prefix: str, entity_def: dict[str, Any], _timezone: str
+) -> str:
+    """Parse a value as an enum text and map it to its canonical key."""
+    return _convert_enum_text_to_key(value, entity_def, log_prefix)
+
+
+def _parse_datetime_or_text(
+    value: str, log_prefix: str, _entity_def: dict[str, Any], timezone: str
+) -> datetime | str | None:
+    """Parse a value as a datetime, keeping HDG's special text values."""
+    return _parse_datetime(value, timezone, log_prefix)
+
+
+def _parse_text(
+    value: str, _log_prefix: str, _entity_def: dict[str, Any], _timezone: str
+) -> str:
+    """Return a text value unchanged."""
+    return value
+
+
+_PARSER_MAP: Final[dict[str, _ValueParser]] = {
+    "int": _parse_int,
+    "float": _parse_float,
+    "enum_text": _parse_enum_text,
+    "hdg_datetime_or_text": _parse_datetime_or_text,
+    "text": _parse_text,
+    "allow_empty_string": _parse_text,
 }
+KNOWN_PARSE_TYPES: Final[frozenset[str]] = frozenset(_PARSER_MAP)
 
 
 def parse_sensor_value(
@@ -246,16 +294,11 @@ def parse_sensor_value(
         raw_value, entity_definition, log_prefix
     )
 
-    if parser is None:
+    if parser is None or cleaned_value is None:
         return cleaned_value  # Return raw or cleaned value if no parser found
 
     try:
-        return parser(
-            cleaned_value,
-            log_prefix,
-            entity_definition,
-            timezone=configured_timezone,
-        )
+        return parser(cleaned_value, log_prefix, entity_definition, configured_timezone)
     except Exception as e:
         _LOGGER.warning(
             "%sError parsing value '%s' as %s: %s. Returning raw.",
@@ -263,6 +306,8 @@ def parse_sensor_value(
             cleaned_value,
             entity_definition.get("parse_as_type"),
             e,
-            exc_info=True,
+            # This repeats on every poll for a malformed value; only pay for
+            # the traceback when debugging.
+            exc_info=_LOGGER.isEnabledFor(logging.DEBUG),
         )
         return cleaned_value
@@ -7,10 +7,11 @@ normalizing strings for comparison or use in unique identifiers.
 
 from __future__ import annotations
 
-__version__ = "0.2.0"
+__version__ = "0.2.1"
 
 import logging
 import re
+from typing import Final
 from urllib.parse import quote
 
 from ..const import DOMAIN, KNOWN_HDG_API_SETTER_SUFFIXES
@@ -28,6 +29,8 @@ __all__ = [
 _SUFFIX_PATTERN = re.compile(
     rf"^(\d+)[{''.join(KNOWN_HDG_API_SETTER_SUFFIXES)}]?$", re.IGNORECASE
 )
+# Tuple form of the known suffixes for the `str.endswith` fast path below.
+_SETTER_SUFFIXES: Final[tuple[str, ...]] = tuple(sorted(KNOWN_HDG_API_SETTER_SUFFIXES))
 
 
 def strip_hdg_node_suffix(node_id_from_def: str) -> str:
@@ -47,6 +50,14 @@ def strip_hdg_node_suffix(node_id_from_def: str) -> str:
     if not node_id_from_def:
         return ""
 
+    # Fast path for the canonical forms ("22003T", "4050") seen on every poll;
+    # anything else (e.g. lowercase suffixes) falls through to the regex.
+    if node_id_from_def.endswith(_SETTER_SUFFIXES):
+        if (base_node_id := node_id_from_def[:-1]).isdecimal():
+            return base_node_id
+    elif node_id_from_def.isdecimal():
+        return node_id_from_def
+
     if match := _SUFFIX_PATTERN.match(node_id_from_def):
         return match[1]
 
@@ -2,16 +2,17 @@
 
 from __future__ import annotations
 
-__version__ = "0.2.0"
+__version__ = "0.2.2"
 
 import logging
+from collections.abc import Mapping
 from decimal import Decimal, InvalidOperation
 from typing import Any
 
 from homeassistant.core import ServiceCall
 from homeassistant.exceptions import ServiceValidationError
 
-from ..const import ATTR_NODE_ID, ATTR_VALUE, DOMAIN
+from ..const import ATTR_NODE_ID, ATTR_VALUE, DOMAIN, NUMERIC_OPTION_BOUNDS
 
 _LOGGER = logging.getLogger(DOMAIN)
 
@@ -20,9 +21,25 @@ __all__ = [
     "validate_get_node_service_call",
     "coerce_value_to_numeric_type",
     "validate_value_range_and_step",
+    "get_bounded_option",
 ]
 
 
+def get_bounded_option(options: Mapping[str, Any], key: str) -> float:
+    """Return a numeric option, clamped to its range in `NUMERIC_OPTION_BOUNDS`.
+
+    Args:
+        options: The config entry options.
+        key: The option key; must be present in `NUMERIC_OPTION_BOUNDS`.
+
+    Returns:
+        The configured value (or its default if unset) within the allowed range.
+
+    """
+    min_val, max_val, default = NUMERIC_OPTION_BOUNDS[key]
+    return min(max(float(options.get(key, default)), min_val), max_val)
+
+
 def _validate_and_get_node_id(call: ServiceCall) -> str:
     """Extract and validate node_id from a service call."""
     node_id_input = call.data.get(ATTR_NODE_ID)
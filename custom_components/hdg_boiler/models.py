@@ -1,18 +1,20 @@
 """Data models and type definitions for the HDG Bavaria Boiler integration.
 
-This module centralizes `TypedDict` definitions used across the integration.
-These models provide type hinting and structure for entity definitions,
-API polling group configurations, and enumeration options.
+This module centralizes the data models used across the integration: `TypedDict`
+definitions for entity definitions, API polling group payloads and enumeration
+options, and a slotted dataclass for the static polling group configuration.
 """
 
 from __future__ import annotations
 
-__version__ = "0.1.6"
+__version__ = "0.1.8"
 
 
-from typing import TypedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, TypedDict
 
-from homeassistant.helpers.entity import EntityCategory
+if TYPE_CHECKING:
+    from homeassistant.helpers.entity import EntityCategory
 
 __all__ = [
     "SensorDefinition",
@@ -101,10 +103,12 @@ class NodeGroupPayload(TypedDict):
     default_scan_interval: int
 
 
-class PollingGroupStaticDefinition(TypedDict):
+@dataclass(slots=True, frozen=True)
+class PollingGroupStaticDefinition:
     """Define the static configuration of a polling group.
 
-    Used in `const.py` for the main list of polling group definitions.
+    Used in `const.py` for the main list of polling group definitions. Instances
+    are immutable and slotted, as they are shared module-level constants.
 
     Attributes:
         key: Unique key for the polling group (e.g., "group_1").
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-__version__ = "0.2.3"
+__version__ = "0.2.4"
 __all__ = ["async_setup_entry"]
 
 import logging
@@ -72,6 +72,9 @@ class HdgBoilerNumber(HdgNodeEntity, NumberEntity):
         """Initialize the HDG Boiler number entity."""
         super().__init__(coordinator, entity_description, entity_definition)
         self._attr_native_value: float | None = None
+        # Setter bounds are static; resolve the integer-step check once instead
+        # of going through the `native_step` property on every state update.
+        self._has_integer_step: bool = entity_description.native_step == 1.0
         self._update_number_state()
         _LIFECYCLE_LOGGER.debug("HdgBoilerNumber %s: Initialized.", self.entity_id)
 
@@ -133,7 +136,7 @@ class HdgBoilerNumber(HdgNodeEntity, NumberEntity):
                 )
             return None
         return (
-            int(math.floor(parsed + 0.5)) if self.native_step == 1.0 else float(parsed)
+            int(math.floor(parsed + 0.5)) if self._has_integer_step else float(parsed)
         )
 
     async def async_set_native_value(self, value: float) -> None:
@@ -144,7 +147,7 @@ class HdgBoilerNumber(HdgNodeEntity, NumberEntity):
 
         # If native_step is 1.0, values are expected to be integers. Round half up.
         self._attr_native_value = (
-            math.floor(value + 0.5) if self.native_step == 1.0 else value
+            math.floor(value + 0.5) if self._has_integer_step else value
         )
         self.async_write_ha_state()
 
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-__version__ = "0.3.0"
+__version__ = "0.3.12"
 __all__ = ["HdgEntityRegistry"]
 
 import logging
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping, Sequence
+from functools import cached_property
 from itertools import groupby
-from typing import cast, Final
+from typing import Final
 
 from .const import DOMAIN, LIFECYCLE_LOGGER_NAME
 from .helpers.string_utils import strip_hdg_node_suffix
@@ -23,16 +24,20 @@ class HdgEntityRegistry:
 
     def __init__(
         self,
-        sensor_definitions: dict[str, SensorDefinition],
-        polling_group_definitions: list[PollingGroupStaticDefinition],
+        sensor_definitions: Mapping[str, SensorDefinition],
+        polling_group_definitions: Sequence[PollingGroupStaticDefinition],
     ) -> None:
         """Initialize the HdgEntityRegistry."""
         self._sensor_definitions: Final = sensor_definitions
         self._polling_group_definitions: Final = polling_group_definitions
+        self._polling_group_definitions_by_key: Final = {
+            group_def.key: group_def for group_def in polling_group_definitions
+        }
         self._polling_group_order: list[str] = []
         self._hdg_node_payloads: dict[str, NodeGroupPayload] = {}
-        self._entities_by_node_id: dict[str, SensorDefinition] = {}
+        self._entities_by_base_node_id: dict[str, SensorDefinition] = {}
         self._writable_entities: list[SensorDefinition] = []
+        self._entities_by_platform: dict[str, dict[str, SensorDefinition]] = {}
         self._added_entity_counts: dict[str, int] = {
             "sensor": 0,
             "number": 0,
@@ -53,24 +58,21 @@ class HdgEntityRegistry:
 
     def _get_valid_sorted_sensor_defs(self) -> list[SensorDefinition]:
         """Filter and sort sensor definitions that belong to a valid polling group."""
-        valid_pg_keys = {pg_def["key"] for pg_def in self._polling_group_definitions}
+        valid_pg_keys = self._polling_group_definitions_by_key
         return sorted(
             (
                 d
                 for d in self._sensor_definitions.values()
-                if d.get("polling_group") in valid_pg_keys and d.get("hdg_node_id")
+                if d["polling_group"] in valid_pg_keys
             ),
-            key=lambda x: x.get("polling_group", ""),
+            key=lambda x: x["polling_group"],
         )
 
     def _create_node_group_payload(
         self, group_key: str, nodes_in_group: list[str]
     ) -> NodeGroupPayload | None:
         """Create a payload object for a polling group."""
-        group_def = next(
-            (gd for gd in self._polling_group_definitions if gd["key"] == group_key),
-            None,
-        )
+        group_def = self._polling_group_definitions_by_key.get(group_key)
         if not group_def:
             return None
 
@@ -80,7 +82,7 @@ class HdgEntityRegistry:
             "name": group_key.replace("_", " ").title(),
             "nodes": nodes_in_group,
             "payload_str": f"nodes={'T-'.join(payload_base_ids)}T",
-            "default_scan_interval": group_def["default_interval"],
+            "default_scan_interval": group_def.default_interval,
         }
 
     def _process_polling_group(
@@ -90,9 +92,7 @@ class HdgEntityRegistry:
         if not group_key:
             return
 
-        nodes_in_group = sorted(
-            {cast(str, d["hdg_node_id"]) for d in group_iter if d.get("hdg_node_id")}
-        )
+        nodes_in_group = sorted({d["hdg_node_id"] for d in group_iter})
         if not nodes_in_group:
             return
 
@@ -106,64 +106,70 @@ class HdgEntityRegistry:
         self._polling_group_order.clear()
         self._hdg_node_payloads.clear()
 
-        for group_key, group_iter in groupby(
-            sorted_defs, lambda x: x.get("polling_group", "")
-        ):
+        for group_key, group_iter in groupby(sorted_defs, lambda x: x["polling_group"]):
             self._process_polling_group(group_key, group_iter)
 
     def _index_entities(self) -> None:
         """Create indexes for efficient entity lookup."""
-        self._entities_by_node_id.clear()
+        self._entities_by_base_node_id.clear()
         self._writable_entities.clear()
-        for definition in self._sensor_definitions.values():
-            if hdg_node_id := definition.get("hdg_node_id"):
-                self._entities_by_node_id[hdg_node_id] = definition
+        self._entities_by_platform.clear()
+        for key, definition in self._sensor_definitions.items():
+            base_node_id = strip_hdg_node_suffix(definition["hdg_node_id"])
+            self._entities_by_base_node_id[base_node_id] = definition
             if definition.get("writable"):
                 self._writable_entities.append(definition)
+            platform = definition["ha_platform"]
+            self._entities_by_platform.setdefault(platform, {})[key] = definition
+
+    @cached_property
+    def _settable_numbers_by_base_node_id(self) -> dict[str, SensorDefinition]:
+        """Index settable number definitions by base node ID.
+
+        Only the `set_node_value` service needs this index, so it is built on
+        first use rather than with the other indexes.
+        """
+        index: dict[str, SensorDefinition] = {}
+        for definition in self._entities_by_platform.get("number", {}).values():
+            if definition.get("setter_type"):
+                base_node_id = strip_hdg_node_suffix(definition["hdg_node_id"])
+                index.setdefault(base_node_id, definition)
+        return index
 
     @staticmethod
     def _strip_trailing_t(node_id: str) -> str:
         """Remove a single trailing 'T' if present, otherwise leave unchanged."""
         return node_id[:-1] if node_id.endswith("T") else node_id
 
-    def get_polling_group_order(self) -> list[str]:
-        """Return the ordered list of polling group keys."""
+    def get_polling_group_order(self) -> Sequence[str]:
+        """Return the ordered polling group keys; callers must not modify them."""
         return self._polling_group_order
 
-    def get_polling_group_payloads(self) -> dict[str, NodeGroupPayload]:
-        """Return the dynamically generated HDG node payloads."""
+    def get_polling_group_payloads(self) -> Mapping[str, NodeGroupPayload]:
+        """Return the dynamically generated HDG node payloads, read-only."""
         return self._hdg_node_payloads
 
-    def get_entity_definition_by_node_id(self, node_id: str) -> SensorDefinition | None:
-        """Return an entity definition by its HDG node ID."""
-        return self._entities_by_node_id.get(node_id)
+    def get_entity_definition_by_base_node_id(
+        self, base_node_id: str
+    ) -> SensorDefinition | None:
+        """Return an entity definition by its base HDG node ID (without suffix)."""
+        return self._entities_by_base_node_id.get(base_node_id)
 
     def get_writable_entity_definitions(self) -> list[SensorDefinition]:
         """Return a list of all writable entity definitions."""
         return self._writable_entities
 
-    def get_entities_for_platform(self, platform: str) -> dict[str, SensorDefinition]:
-        """Return a dictionary of entity definitions for a given platform."""
-        return {
-            key: definition
-            for key, definition in self._sensor_definitions.items()
-            if definition.get("ha_platform") == platform
-        }
+    def get_entities_for_platform(
+        self, platform: str
+    ) -> Mapping[str, SensorDefinition]:
+        """Return the entity definitions for a given platform, read-only."""
+        return self._entities_by_platform.get(platform, {})
 
     def get_settable_number_definition_by_base_node_id(
         self, base_node_id: str
     ) -> SensorDefinition | None:
         """Find a settable 'number' definition by its base node ID."""
-        for definition in self._sensor_definitions.values():
-            hdg_node_id = definition.get("hdg_node_id")
-            if (
-                isinstance(hdg_node_id, str)
-                and strip_hdg_node_suffix(hdg_node_id) == base_node_id
-                and definition.get("ha_platform") == "number"
-                and definition.get("setter_type")
-            ):
-                return definition
-        return None
+        return self._settable_numbers_by_base_node_id.get(base_node_id)
 
     def increment_added_entity_count(self, platform: str, count: int) -> None:
         """Increment the count of successfully added entities for a given platform."""
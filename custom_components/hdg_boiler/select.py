@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-__version__ = "1.0.1"
+__version__ = "1.0.3"
 __all__ = ["async_setup_entry"]
 
 import logging
@@ -77,8 +77,10 @@ class HdgBoilerSelect(HdgNodeEntity, SelectEntity):
             optimistic_value = self.coordinator._setter_state["optimistic_values"].get(
                 self._node_id
             )
+            # Callers pass API strings by contract; the coordinator does not
+            # check the type, so convert defensively.
             if optimistic_value is not None:
-                processed_value = str(cast(str, optimistic_value))
+                processed_value = str(optimistic_value)
                 _LOGGER.debug(
                     "[%s] Using optimistic value '%s'",
                     self.entity_description.key,
@@ -91,11 +93,14 @@ class HdgBoilerSelect(HdgNodeEntity, SelectEntity):
         if self.coordinator.data and (
             raw_value := self.coordinator.data.get(self._node_id)
         ):
-            if raw_value is not None:
-                processed_value = str(cast(str | int | float, raw_value))
-                if self._entity_definition.get("uppercase_value"):
-                    return processed_value.lower()
-                return processed_value
+            processed_value = (
+                raw_value
+                if type(raw_value) is str
+                else str(cast(str | int | float, raw_value))
+            )
+            if self._entity_definition.get("uppercase_value"):
+                return processed_value.lower()
+            return processed_value
         return None
 
     async def async_select_option(self, option: str) -> None:
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-__version__ = "0.2.0"
+__version__ = "0.2.1"
 __all__ = ["async_setup_entry"]
 
 import logging
@@ -68,6 +68,10 @@ class HdgBoilerSensor(HdgNodeEntity, SensorEntity):
         """Initialize the HDG Boiler sensor entity."""
         super().__init__(coordinator, entity_description, entity_definition)
         self._attr_native_value = None
+        # Option changes reload the entry, so the timezone is fixed for our lifetime.
+        self._configured_timezone: str = coordinator.entry.options.get(
+            CONF_SOURCE_TIMEZONE, DEFAULT_SOURCE_TIMEZONE
+        )
         # Set initial state, coordinator data should be available after first refresh
         self._update_sensor_state()
         _LIFECYCLE_LOGGER.debug("HdgBoilerSensor %s: Initialized.", self.entity_id)
@@ -90,9 +94,7 @@ class HdgBoilerSensor(HdgNodeEntity, SensorEntity):
             entity_definition=cast(dict[str, Any], self._entity_definition),
             node_id_for_log=self._node_id,
             entity_id_for_log=self.entity_id,
-            configured_timezone=self.coordinator.entry.options.get(
-                CONF_SOURCE_TIMEZONE, DEFAULT_SOURCE_TIMEZONE
-            ),
+            configured_timezone=self._configured_timezone,
         )
         self._attr_native_value = parsed_value
 